@@ -1,17 +1,27 @@
 """The Firewalla integration."""
 from __future__ import annotations
 
+import asyncio
 import logging
-from datetime import timedelta
-from typing import Any
+from collections.abc import Coroutine, Iterator
+from dataclasses import dataclass
+from functools import partial
+from typing import Any, Final
 
 import voluptuous as vol
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import CONF_SCAN_INTERVAL
+from homeassistant.const import ATTR_DEVICE_ID
 from homeassistant.core import HomeAssistant, ServiceCall, SupportsResponse
-from homeassistant.helpers import device_registry as dr, entity_registry as er
+from homeassistant.helpers import (
+    config_validation as cv,
+    device_registry as dr,
+    entity_registry as er,
+)
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.debounce import Debouncer
+from homeassistant.helpers.service import async_extract_referenced_entity_ids
+from homeassistant.helpers.typing import ConfigType
 
 from .api import FirewallaApiClient
 from .const import (
@@ -25,7 +35,6 @@ from .const import (
     CONF_ENABLE_TRAFFIC,
     CONF_SUBDOMAIN,
     CONF_TRACK_DEVICES,
-    DEFAULT_SCAN_INTERVAL,
     DEFAULT_SUBDOMAIN,
     DOMAIN,
     PLATFORMS,
@@ -33,51 +42,90 @@ from .const import (
     SERVICE_RENAME_DEVICE,
     SERVICE_SEARCH_ALARMS,
     SERVICE_SEARCH_FLOWS,
+    UID_PREFIX_ALARM,
+    UID_PREFIX_ALARM_COUNT,
+    UID_PREFIX_FLOW,
+    UID_PREFIX_RULE,
+    UID_PREFIX_RULE_SWITCH,
+    UID_PREFIX_TARGET_LIST,
+    UID_PREFIX_TOTAL_DOWNLOAD,
+    UID_PREFIX_TOTAL_UPLOAD,
+    UID_PREFIX_TRACKER,
 )
-from .coordinator import FirewallaCoordinator
+from .coordinator import FirewallaCoordinator, FirewallaSettings
 from .helpers import box_display_name, safe_configuration_url
 
 _LOGGER = logging.getLogger(__name__)
 
+CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
+
+# Quiet period after an options change before the entry is reloaded.
+_RELOAD_COOLDOWN: Final = 0.5
+
+# Service schemas are compiled once at import rather than per registration.
+# The targeted services accept every target kind the UI picker offers
+# (entities, devices, areas, labels); handlers resolve them with
+# async_extract_referenced_entity_ids.
+_DELETE_ALARM_SCHEMA = cv.make_entity_service_schema({})
+_RENAME_DEVICE_SCHEMA = cv.make_entity_service_schema(
+    {
+        vol.Required("name"): vol.All(str, vol.Length(min=1, max=32)),
+    }
+)
+_SEARCH_SCHEMA = vol.Schema(
+    {
+        vol.Required("query"): str,
+        vol.Optional("limit", default=50): vol.All(
+            int, vol.Range(min=1, max=200)
+        ),
+    }
+)
+
 
 # -----------------------------------------------------------------------
 # Runtime data container
 # -----------------------------------------------------------------------
 
+@dataclass(frozen=True, slots=True)
 class FirewallaData:
     """Container for per-entry runtime objects."""
 
-    def __init__(
-        self, client: FirewallaApiClient, coordinator: FirewallaCoordinator
-    ) -> None:
-        self.client = client
-        self.coordinator = coordinator
+    client: FirewallaApiClient
+    coordinator: FirewallaCoordinator
+    settings: FirewallaSettings
+    reload_debouncer: Debouncer[Coroutine[Any, Any, bool]]
 
 
 # -----------------------------------------------------------------------
 # Setup / unload
 # -----------------------------------------------------------------------
 
+async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
+    """Register domain services once when the integration is loaded.
+
+    Services stay registered for the lifetime of HA; handlers only act on
+    config entries that are currently loaded, so no per-entry registration
+    or removal is needed.
+    """
+    _async_register_services(hass)
+    return True
+
+
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Firewalla from a config entry."""
-    session = async_get_clientsession(hass)
+    settings = FirewallaSettings.from_entry(entry)
 
     client = FirewallaApiClient(
-        session=session,
+        session=async_get_clientsession(hass),
         api_token=entry.data.get(CONF_API_TOKEN, ""),
         subdomain=entry.data.get(CONF_SUBDOMAIN, DEFAULT_SUBDOMAIN),
     )
 
-    scan_interval = entry.options.get(
-        CONF_SCAN_INTERVAL,
-        entry.data.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL),
-    )
-
     coordinator = FirewallaCoordinator(
         hass,
         client=client,
         entry=entry,
-        update_interval=timedelta(seconds=scan_interval),
+        settings=settings,
     )
 
     # Load persisted device-seen timestamps so stale-device tracking
@@ -89,7 +137,19 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     # the coordinator so HA surfaces a re-auth notification.
     await coordinator.async_config_entry_first_refresh()
 
-    entry.runtime_data = FirewallaData(client, coordinator)
+    # Options saves in quick succession collapse into a single reload.
+    reload_debouncer = Debouncer(
+        hass,
+        _LOGGER,
+        cooldown=_RELOAD_COOLDOWN,
+        immediate=False,
+        function=partial(hass.config_entries.async_reload, entry.entry_id),
+    )
+    entry.async_on_unload(reload_debouncer.async_cancel)
+
+    entry.runtime_data = FirewallaData(
+        client, coordinator, settings, reload_debouncer
+    )
 
     # Apply debug logging preference before platforms load so any setup
     # debug messages are captured if the user has the toggle enabled.
@@ -107,33 +167,12 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
     entry.async_on_unload(entry.add_update_listener(_async_update_options))
 
-    # Register domain-level services once (idempotent across entries).
-    _async_register_services(hass)
-
     return True
 
 
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
-    unloaded = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
-
-    # Remove domain services when last entry unloads.
-    if unloaded:
-        remaining = [
-            e
-            for e in hass.config_entries.async_entries(DOMAIN)
-            if e.entry_id != entry.entry_id
-        ]
-        if not remaining:
-            for svc in (
-                SERVICE_DELETE_ALARM,
-                SERVICE_RENAME_DEVICE,
-                SERVICE_SEARCH_ALARMS,
-                SERVICE_SEARCH_FLOWS,
-            ):
-                hass.services.async_remove(DOMAIN, svc)
-
-    return unloaded
+    return await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
 
 
 async def async_remove_config_entry_device(
@@ -142,14 +181,7 @@ async def async_remove_config_entry_device(
     device_entry: dr.DeviceEntry,
 ) -> bool:
     """Handle the 'Delete' button on a device page in the HA UI."""
-    fw_device_id: str | None = None
-    for domain, identifier in device_entry.identifiers:
-        if domain != DOMAIN:
-            continue
-        if identifier.startswith("box_") or identifier.startswith("msp_global_"):
-            return False
-        fw_device_id = identifier
-
+    fw_device_id = _fw_device_id(device_entry)
     if not fw_device_id:
         return False
 
@@ -157,16 +189,9 @@ async def async_remove_config_entry_device(
     client: FirewallaApiClient = config_entry.runtime_data.client
 
     fw_box_id: str | None = None
-    if coordinator.data:
-        device_data = next(
-            (
-                d for d in coordinator.data.get("devices", [])
-                if d.get("id") == fw_device_id
-            ),
-            None,
-        )
-        if device_data:
-            fw_box_id = device_data.get("gid") or device_data.get("boxId")
+    device_data = coordinator.devices_by_id.get(fw_device_id)
+    if device_data:
+        fw_box_id = device_data.get("gid") or device_data.get("boxId")
 
     if fw_box_id:
         success = await client.async_delete_device(fw_box_id, fw_device_id)
@@ -193,7 +218,7 @@ async def _async_update_options(hass: HomeAssistant, entry: ConfigEntry) -> None
     """Handle options update — apply log level, clean up orphaned entities, then reload."""
     _async_apply_debug_logging(entry)
     _async_cleanup_disabled_entities(hass, entry)
-    await hass.config_entries.async_reload(entry.entry_id)
+    await entry.runtime_data.reload_debouncer.async_call()
 
 
 # -----------------------------------------------------------------------
@@ -239,7 +264,7 @@ def _async_preregister_boxes(
     dev_reg = dr.async_get(hass)
 
     for box in coordinator.data.get("boxes", []):
-        if not isinstance(box, dict) or "id" not in box:
+        if "id" not in box:
             continue
         box_id = box["id"]
         dev_reg.async_get_or_create(
@@ -258,48 +283,75 @@ def _async_preregister_boxes(
 # Orphaned-entity cleanup
 # -----------------------------------------------------------------------
 
+# Unique-id prefixes owned by each optional feature. Option keys double as
+# FirewallaSettings field names, so each flag is read with getattr().
+_FEATURE_PREFIXES: Final[tuple[tuple[str, tuple[str, ...]], ...]] = (
+    (CONF_ENABLE_ALARMS, (UID_PREFIX_ALARM, UID_PREFIX_ALARM_COUNT)),
+    (CONF_ENABLE_RULES, (UID_PREFIX_RULE, UID_PREFIX_RULE_SWITCH)),
+    (CONF_ENABLE_FLOWS, (UID_PREFIX_FLOW,)),
+    (CONF_ENABLE_TRAFFIC, (UID_PREFIX_TOTAL_DOWNLOAD, UID_PREFIX_TOTAL_UPLOAD)),
+    (CONF_TRACK_DEVICES, (UID_PREFIX_TRACKER,)),
+    (CONF_ENABLE_TARGET_LISTS, (UID_PREFIX_TARGET_LIST,)),
+)
+
+
 def _async_cleanup_disabled_entities(
     hass: HomeAssistant, entry: ConfigEntry
 ) -> None:
     """Remove entities belonging to features that the user has disabled."""
-    opts = entry.options
-
-    def _opt(key: str) -> bool:
-        return opts.get(key, entry.data.get(key, False))
+    # Resolve from the entry rather than runtime_data: this runs from the
+    # options listener, before the reload picks up the new options.
+    settings = FirewallaSettings.from_entry(entry)
+
+    disabled = [
+        (flag, prefixes)
+        for flag, prefixes in _FEATURE_PREFIXES
+        if not getattr(settings, flag)
+    ]
+
+    # Flatten the prefixes of every disabled feature into one tuple so each
+    # entity needs a single str.startswith() call instead of a per-feature
+    # any() scan.
+    disabled_prefixes = tuple(
+        prefix for _flag, prefixes in disabled for prefix in prefixes
+    )
+    if not disabled_prefixes:
+        # Every feature is enabled — nothing can be orphaned, so skip the
+        # registry walk entirely.
+        return
 
     ent_reg = er.async_get(hass)
 
-    cleanup_map: dict[str, list[str]] = {
-        CONF_ENABLE_ALARMS: [
-            f"{DOMAIN}_alarm_",
-            f"{DOMAIN}_alarm_count_",
-        ],
-        CONF_ENABLE_RULES: [
-            f"{DOMAIN}_rule_",
-            f"{DOMAIN}_rule_switch_",
-        ],
-        CONF_ENABLE_FLOWS: [
-            f"{DOMAIN}_flow_",
-        ],
-        CONF_ENABLE_TRAFFIC: [
-            f"{DOMAIN}_total_download_",
-            f"{DOMAIN}_total_upload_",
-        ],
-        CONF_TRACK_DEVICES: [
-            f"{DOMAIN}_tracker_",
-        ],
-        CONF_ENABLE_TARGET_LISTS: [
-            f"{DOMAIN}_target_list_",
-        ],
-    }
+    # Only build the prefix -> feature map (used purely for log output)
+    # when debug logging is actually enabled.
+    debug_on = _LOGGER.isEnabledFor(logging.DEBUG)
+    prefix_flags: dict[str, str] = (
+        {prefix: flag for flag, prefixes in disabled for prefix in prefixes}
+        if debug_on
+        else {}
+    )
 
-    for flag, prefixes in cleanup_map.items():
-        if _opt(flag):
-            continue
-        for ent in er.async_entries_for_config_entry(ent_reg, entry.entry_id):
-            if any(ent.unique_id.startswith(p) for p in prefixes):
-                _LOGGER.debug("Removing orphaned entity %s", ent.entity_id)
-                ent_reg.async_remove(ent.entity_id)
+    # Collect first, then remove in one tight synchronous pass so the
+    # registry's debounced save is scheduled once for the whole batch.
+    to_remove = [
+        ent
+        for ent in er.async_entries_for_config_entry(ent_reg, entry.entry_id)
+        if ent.unique_id.startswith(disabled_prefixes)
+    ]
+
+    remove = ent_reg.async_remove
+    for ent in to_remove:
+        if debug_on:
+            _LOGGER.debug(
+                "Removing orphaned entity %s (%s is disabled)",
+                ent.entity_id,
+                next(
+                    flag
+                    for prefix, flag in prefix_flags.items()
+                    if ent.unique_id.startswith(prefix)
+                ),
+            )
+        remove(ent.entity_id)
 
 
 # -----------------------------------------------------------------------
@@ -307,235 +359,287 @@ def _async_cleanup_disabled_entities(
 # -----------------------------------------------------------------------
 
 def _async_register_services(hass: HomeAssistant) -> None:
-    """Register Firewalla domain services (idempotent)."""
+    """Register Firewalla domain services."""
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_DELETE_ALARM,
+        _async_handle_delete_alarm,
+        schema=_DELETE_ALARM_SCHEMA,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_RENAME_DEVICE,
+        _async_handle_rename_device,
+        schema=_RENAME_DEVICE_SCHEMA,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_SEARCH_ALARMS,
+        _async_handle_search_alarms,
+        schema=_SEARCH_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_SEARCH_FLOWS,
+        _async_handle_search_flows,
+        schema=_SEARCH_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
 
-    if hass.services.has_service(DOMAIN, SERVICE_DELETE_ALARM):
-        return
 
-    # -- delete_alarm ------------------------------------------------
+# -- delete_alarm ----------------------------------------------------
 
-    async def _handle_delete_alarm(call: ServiceCall) -> None:
-        entity_ids = call.data.get("entity_id", [])
-        if isinstance(entity_ids, str):
-            entity_ids = [entity_ids]
+async def _async_handle_delete_alarm(call: ServiceCall) -> None:
+    """Delete the alarms behind the targeted alarm binary sensors.
 
-        for entity_id in entity_ids:
-            state = hass.states.get(entity_id)
-            if not state:
-                _LOGGER.error("Entity %s not found", entity_id)
-                continue
+    Entities named directly must be alarm sensors. A directly targeted
+    device (a box) contributes all of its alarm sensors; areas and labels
+    are not expanded, so one broad target cannot dismiss alarms in bulk.
+    """
+    hass = call.hass
+    ent_reg = er.async_get(hass)
+    selected = async_extract_referenced_entity_ids(hass, call)
+
+    entity_ids = sorted(
+        selected.referenced
+        | {
+            ent_entry.entity_id
+            for device_id in _targeted_device_ids(call)
+            for ent_entry in er.async_entries_for_device(ent_reg, device_id)
+            if _is_alarm_entity(ent_reg, ent_entry.entity_id)
+        }
+    )
+    if not entity_ids:
+        _LOGGER.error("No Firewalla alarm entities targeted")
+        return
 
-            alarm_id = state.attributes.get(ATTR_ALARM_ID)
-            gid = state.attributes.get("gid")
+    for entity_id in entity_ids:
+        state = hass.states.get(entity_id)
+        if not state:
+            _LOGGER.error("Entity %s not found", entity_id)
+            continue
 
-            if not alarm_id:
-                _LOGGER.error("Entity %s has no alarm_id attribute", entity_id)
-                continue
+        alarm_id = state.attributes.get(ATTR_ALARM_ID)
+        gid = state.attributes.get("gid")
 
-            if not gid:
-                ent_reg = er.async_get(hass)
-                ent_entry = ent_reg.async_get(entity_id)
-                if ent_entry and ent_entry.config_entry_id:
-                    cfg = hass.config_entries.async_get_entry(
-                        ent_entry.config_entry_id
-                    )
-                    if cfg and hasattr(cfg, "runtime_data"):
-                        coord = cfg.runtime_data.coordinator
-                        alarm = next(
-                            (
-                                a
-                                for a in coord.data.get("alarms", [])
-                                if str(a.get("id")) == str(alarm_id)
-                                or str(a.get("aid")) == str(alarm_id)
-                            ),
-                            None,
-                        )
-                        if alarm:
-                            gid = alarm.get("gid")
-
-            if not gid:
-                _LOGGER.error(
-                    "Cannot determine box GID for alarm %s", alarm_id
-                )
-                continue
+        if not alarm_id:
+            _LOGGER.error("Entity %s has no alarm_id attribute", entity_id)
+            continue
 
-            client = _client_for_entity(hass, entity_id)
-            if not client:
-                _LOGGER.error("No API client found for %s", entity_id)
-                continue
+        # Resolve the owning entry once; it supplies both the gid fallback
+        # and the API client.
+        runtime = _runtime_data_for_entity(hass, ent_reg, entity_id)
 
-            aid = alarm_id
-            if await client.async_delete_alarm(gid, aid):
-                _LOGGER.info("Deleted alarm %s/%s", gid, aid)
-            else:
-                _LOGGER.error("API rejected deletion of alarm %s/%s", gid, aid)
+        if not gid and runtime:
+            alarm = runtime.coordinator.alarms_by_id.get(str(alarm_id))
+            if alarm:
+                gid = alarm.get("gid")
 
-    hass.services.async_register(
-        DOMAIN,
-        SERVICE_DELETE_ALARM,
-        _handle_delete_alarm,
-        schema=vol.Schema({}),
-    )
+        if not gid:
+            _LOGGER.error(
+                "Cannot determine box GID for alarm %s", alarm_id
+            )
+            continue
 
-    # -- rename_device -----------------------------------------------
+        if not runtime:
+            _LOGGER.error("No API client found for %s", entity_id)
+            continue
+        client = runtime.client
 
-    async def _handle_rename_device(call: ServiceCall) -> None:
-        device_ids = call.data.get("device_id", [])
-        if isinstance(device_ids, str):
-            device_ids = [device_ids]
-        name = call.data.get("name", "")
-        if not name or len(name) > 32:
-            _LOGGER.error("Name must be 1-32 characters")
-            return
+        aid = alarm_id
+        if await client.async_delete_alarm(gid, aid):
+            _LOGGER.info("Deleted alarm %s/%s", gid, aid)
+        else:
+            _LOGGER.error("API rejected deletion of alarm %s/%s", gid, aid)
 
-        dev_reg = dr.async_get(hass)
 
-        for ha_device_id in device_ids:
-            device_entry = dev_reg.async_get(ha_device_id)
-            if not device_entry:
-                _LOGGER.error("Device %s not found", ha_device_id)
-                continue
+# -- rename_device ---------------------------------------------------
 
-            fw_device_id: str | None = None
-            for domain, identifier in device_entry.identifiers:
-                if domain != DOMAIN:
-                    continue
-                if identifier.startswith("box_") or identifier.startswith("msp_global_"):
-                    continue
-                fw_device_id = identifier
-
-            if not fw_device_id:
-                _LOGGER.error(
-                    "Cannot find Firewalla device ID for HA device %s",
-                    ha_device_id,
-                )
-                continue
+async def _async_handle_rename_device(call: ServiceCall) -> None:
+    """Rename the Firewalla devices behind the targeted HA devices.
 
-            client: FirewallaApiClient | None = None
-            fw_box_id: str | None = None
-            for cfg in hass.config_entries.async_entries(DOMAIN):
-                if not hasattr(cfg, "runtime_data"):
-                    continue
-                coord = cfg.runtime_data.coordinator
-                if not coord.data:
-                    continue
-                device_data = next(
-                    (
-                        d
-                        for d in coord.data.get("devices", [])
-                        if d.get("id") == fw_device_id
-                    ),
-                    None,
-                )
-                if device_data:
-                    fw_box_id = device_data.get("gid") or device_data.get("boxId")
-                    client = cfg.runtime_data.client
-                    break
-
-            if not fw_box_id or not client:
-                _LOGGER.error(
-                    "Cannot determine box ID for device %s", fw_device_id
-                )
-                continue
+    Only devices named directly, or owning a directly named entity, are
+    renamed. Areas and labels are not expanded: one area target would
+    otherwise give every Firewalla device in it the same name.
+    """
+    hass = call.hass
+    name = call.data["name"]
+    dev_reg = dr.async_get(hass)
+    ent_reg = er.async_get(hass)
+    selected = async_extract_referenced_entity_ids(hass, call)
 
-            if await client.async_rename_device(fw_box_id, fw_device_id, name):
-                _LOGGER.info("Renamed device %s to '%s'", fw_device_id, name)
-            else:
-                _LOGGER.error("Failed to rename device %s", fw_device_id)
+    # Targeted entities stand for the device they belong to.
+    ha_device_ids = set(_targeted_device_ids(call))
+    for entity_id in selected.referenced:
+        if (ent := ent_reg.async_get(entity_id)) and ent.device_id:
+            ha_device_ids.add(ent.device_id)
 
-    hass.services.async_register(
-        DOMAIN,
-        SERVICE_RENAME_DEVICE,
-        _handle_rename_device,
-        schema=vol.Schema(
-            {
-                vol.Required("name"): vol.All(str, vol.Length(min=1, max=32)),
-            }
-        ),
-    )
+    if not ha_device_ids:
+        _LOGGER.error("No Firewalla devices targeted")
+        return
 
-    # -- search_alarms -----------------------------------------------
+    for ha_device_id in sorted(ha_device_ids):
+        device_entry = dev_reg.async_get(ha_device_id)
+        if not device_entry:
+            _LOGGER.error("Device %s not found", ha_device_id)
+            continue
 
-    async def _handle_search_alarms(call: ServiceCall) -> dict[str, Any]:
-        query = call.data.get("query", "")
-        limit = call.data.get("limit", 50)
-        all_results: list[dict[str, Any]] = []
+        fw_device_id = _fw_device_id(device_entry)
+        if not fw_device_id:
+            _LOGGER.error(
+                "Cannot find Firewalla device ID for HA device %s",
+                ha_device_id,
+            )
+            continue
 
-        for cfg in hass.config_entries.async_entries(DOMAIN):
-            if not hasattr(cfg, "runtime_data"):
+        client: FirewallaApiClient | None = None
+        fw_box_id: str | None = None
+        # The device registry already records which config entries own
+        # this device, so dispatch straight to them rather than probing
+        # every loaded Firewalla account.
+        for entry_id in device_entry.config_entries:
+            cfg = hass.config_entries.async_get_entry(entry_id)
+            if (
+                cfg is None
+                or cfg.domain != DOMAIN
+                or getattr(cfg, "runtime_data", None) is None
+            ):
                 continue
-            client = cfg.runtime_data.client
-            try:
-                result = await client.search_alarms(query, limit)
-                all_results.extend(result.get("results", []))
-            except Exception as exc:  # noqa: BLE001
-                _LOGGER.warning("search_alarms error for %s: %s", cfg.title, exc)
+            runtime: FirewallaData = cfg.runtime_data
+            device_data = runtime.coordinator.devices_by_id.get(fw_device_id)
+            if device_data:
+                fw_box_id = device_data.get("gid") or device_data.get("boxId")
+                client = runtime.client
+                break
+
+        if not fw_box_id or not client:
+            _LOGGER.error(
+                "Cannot determine box ID for device %s", fw_device_id
+            )
+            continue
 
-        return {"count": len(all_results), "results": all_results}
+        if await client.async_rename_device(fw_box_id, fw_device_id, name):
+            _LOGGER.info("Renamed device %s to '%s'", fw_device_id, name)
+        else:
+            _LOGGER.error("Failed to rename device %s", fw_device_id)
 
-    hass.services.async_register(
-        DOMAIN,
-        SERVICE_SEARCH_ALARMS,
-        _handle_search_alarms,
-        schema=vol.Schema(
-            {
-                vol.Required("query"): str,
-                vol.Optional("limit", default=50): vol.All(
-                    int, vol.Range(min=1, max=200)
-                ),
-            }
-        ),
-        supports_response=SupportsResponse.OPTIONAL,
+
+# -- search_alarms ---------------------------------------------------
+
+async def _async_handle_search_alarms(call: ServiceCall) -> dict[str, Any]:
+    """Search alarms across every loaded Firewalla account."""
+    query = call.data["query"]
+    limit = call.data["limit"]
+    all_results: list[dict[str, Any]] = []
+
+    # Query every account concurrently so multi-account installs pay one
+    # round-trip of latency rather than one per account.
+    entries = list(_iter_loaded_entries(call.hass))
+    results = await asyncio.gather(
+        *(cfg.runtime_data.client.search_alarms(query, limit) for cfg in entries),
+        return_exceptions=True,
     )
+    for cfg, result in zip(entries, results):
+        if isinstance(result, BaseException):
+            _LOGGER.warning("search_alarms error for %s: %s", cfg.title, result)
+            continue
+        all_results.extend(result.get("results", []))
 
-    # -- search_flows ------------------------------------------------
+    return {"count": len(all_results), "results": all_results}
 
-    async def _handle_search_flows(call: ServiceCall) -> dict[str, Any]:
-        query = call.data.get("query", "")
-        limit = call.data.get("limit", 50)
-        all_results: list[dict[str, Any]] = []
 
-        for cfg in hass.config_entries.async_entries(DOMAIN):
-            if not hasattr(cfg, "runtime_data"):
-                continue
-            client = cfg.runtime_data.client
-            try:
-                result = await client.search_flows(query, limit)
-                all_results.extend(result.get("results", []))
-            except Exception as exc:  # noqa: BLE001
-                _LOGGER.warning("search_flows error for %s: %s", cfg.title, exc)
+# -- search_flows ----------------------------------------------------
 
-        return {"count": len(all_results), "results": all_results}
+async def _async_handle_search_flows(call: ServiceCall) -> dict[str, Any]:
+    """Search flows across every loaded Firewalla account."""
+    query = call.data["query"]
+    limit = call.data["limit"]
+    all_results: list[dict[str, Any]] = []
 
-    hass.services.async_register(
-        DOMAIN,
-        SERVICE_SEARCH_FLOWS,
-        _handle_search_flows,
-        schema=vol.Schema(
-            {
-                vol.Required("query"): str,
-                vol.Optional("limit", default=50): vol.All(
-                    int, vol.Range(min=1, max=200)
-                ),
-            }
-        ),
-        supports_response=SupportsResponse.OPTIONAL,
+    # Query every account concurrently so multi-account installs pay one
+    # round-trip of latency rather than one per account.
+    entries = list(_iter_loaded_entries(call.hass))
+    results = await asyncio.gather(
+        *(cfg.runtime_data.client.search_flows(query, limit) for cfg in entries),
+        return_exceptions=True,
     )
+    for cfg, result in zip(entries, results):
+        if isinstance(result, BaseException):
+            _LOGGER.warning("search_flows error for %s: %s", cfg.title, result)
+            continue
+        all_results.extend(result.get("results", []))
+
+    return {"count": len(all_results), "results": all_results}
 
 
 # -----------------------------------------------------------------------
 # Helpers
 # -----------------------------------------------------------------------
 
-def _client_for_entity(
-    hass: HomeAssistant, entity_id: str
-) -> FirewallaApiClient | None:
-    """Return the API client that owns a given entity."""
-    ent_reg = er.async_get(hass)
+def _iter_loaded_entries(hass: HomeAssistant) -> Iterator[ConfigEntry]:
+    """Yield Firewalla config entries that currently have runtime data."""
+    return (
+        cfg
+        for cfg in hass.config_entries.async_entries(DOMAIN)
+        if getattr(cfg, "runtime_data", None) is not None
+    )
+
+
+def _targeted_device_ids(call: ServiceCall) -> list[str]:
+    """Return the device ids a service call names directly.
+
+    Unlike async_extract_referenced_entity_ids this does not expand areas
+    or labels into the devices they contain.
+    """
+    device_ids = call.data.get(ATTR_DEVICE_ID)
+    # Absent, or the ENTITY_MATCH_NONE sentinel string.
+    if not isinstance(device_ids, list):
+        return []
+    return device_ids
+
+
+def _is_alarm_entity(ent_reg: er.EntityRegistry, entity_id: str) -> bool:
+    """Return True if the entity is one of this integration's alarm sensors."""
+    ent_entry = ent_reg.async_get(entity_id)
+    # Alarm sensors are binary sensors; the domain check also rules out the
+    # alarm-count sensor, whose UID_PREFIX_ALARM_COUNT shares the prefix.
+    return (
+        ent_entry is not None
+        and ent_entry.platform == DOMAIN
+        and ent_entry.domain == "binary_sensor"
+        and ent_entry.unique_id.startswith(UID_PREFIX_ALARM)
+    )
+
+
+def _runtime_data_for_entity(
+    hass: HomeAssistant, ent_reg: er.EntityRegistry, entity_id: str
+) -> FirewallaData | None:
+    """Return the runtime data of the config entry that owns an entity."""
     ent_entry = ent_reg.async_get(entity_id)
     if not ent_entry or not ent_entry.config_entry_id:
         return None
     cfg = hass.config_entries.async_get_entry(ent_entry.config_entry_id)
-    if cfg and hasattr(cfg, "runtime_data"):
-        return cfg.runtime_data.client
-    return None
+    if cfg is None:
+        return None
+    return getattr(cfg, "runtime_data", None)
+
+
+def _fw_device_id(device_entry: dr.DeviceEntry) -> str | None:
+    """Return the Firewalla network-device id behind an HA device entry.
+
+    Box and MSP service devices return None — they anchor the integration's
+    other entities and are not individually renamable or deletable.
+    """
+    domain_ids = {
+        identifier
+        for domain, identifier in device_entry.identifiers
+        if domain == DOMAIN
+    }
+    if not domain_ids or any(
+        identifier.startswith(("box_", "msp_global_")) for identifier in domain_ids
+    ):
+        return None
+    # Set order is arbitrary, so pick deterministically: Firewalla device ids
+    # are MAC strings, so a MAC-shaped identifier wins, then the lowest one.
+    return min(domain_ids, key=lambda identifier: (":" not in identifier, identifier))
@@ -8,11 +8,18 @@ from __future__ import annotations
 import asyncio
 import logging
 import time
-from datetime import datetime, timezone
+from collections.abc import AsyncIterator, Awaitable, Callable
+from dataclasses import dataclass, field
 from typing import Any
 
 import aiohttp
-import async_timeout
+from aiohttp.hdrs import USER_AGENT
+
+from homeassistant.helpers.aiohttp_client import SERVER_SOFTWARE
+from homeassistant.helpers.json import json_dumps
+from homeassistant.util.async_ import create_eager_task
+from homeassistant.util.json import json_loads
+from homeassistant.util.ssl import get_default_context
 
 from .const import (
     DEFAULT_API_URL,
@@ -25,42 +32,226 @@ _LOGGER = logging.getLogger(__name__)
 # Maximum pages to follow when paginating cursored endpoints (safety cap).
 _MAX_PAGES = 20
 
+# Devices without an explicit "online" flag count as online if they were
+# active within this window.
+_ONLINE_THRESHOLD_MS = 15 * 60 * 1000
+
+# Per-request timeout, enforced by aiohttp itself rather than an extra
+# asyncio timeout context wrapped around each call.
+_CLIENT_TIMEOUT = aiohttp.ClientTimeout(total=DEFAULT_TIMEOUT)
+
+# HTTP statuses treated as success by _api_request.
+_OK_STATUSES = frozenset({200, 201, 204})
+
+# Collection endpoints whose URLs never change, pre-built per client.
+_STATIC_ENDPOINTS = (
+    "boxes",
+    "devices",
+    "rules",
+    "alarms",
+    "flows",
+    "target-lists",
+    "stats/simple",
+)
+
+# Seconds to stop polling an optional feature endpoint (one an MSP plan may
+# not expose) after it answers 403/404, before probing it again.
+_UNAVAILABLE_RETRY = 3600
+
+# Listings that rarely change; requested conditionally when the API has
+# supplied an ETag for them.
+_CONDITIONAL_ENDPOINTS = frozenset({"boxes", "rules", "target-lists"})
+
+# Seconds a successful response stays fresh for low-churn endpoints.
+# Rules change only when edited; stats/simple is a fleet summary that
+# tolerates a minute of lag. Boxes are not cached because their online
+# state backs the connectivity sensors, and target lists rely on the
+# conditional request instead so edits show up on the next poll.
+_CACHE_TTLS: dict[str, float] = {
+    "rules": 120,
+    "stats/simple": 60,
+}
+
+# Connection pool tuning for sessions the client creates itself. Capping
+# per-host connections keeps one busy MSP account from starving another.
+# The keep-alive stays below the common 60 s server idle timeout so a pooled
+# socket is never reused after the server closed it; it therefore only saves
+# handshakes within one poll's concurrent fan-out, not between polls.
+_FIREWALLA_LIMIT_PER_HOST = 10
+_FIREWALLA_KEEPALIVE_TIMEOUT = 50
+_FIREWALLA_DNS_CACHE_TTL = 300
+
+
+@dataclass(slots=True)
+class FirewallaBundle:
+    """Results of one concurrent fetch across the polled endpoints.
+
+    Endpoints that were not requested, or that raised, are left as None;
+    the exception of a failed endpoint is recorded in ``errors`` under the
+    field name.
+    """
+
+    boxes: list[dict[str, Any]] | None = None
+    devices: list[dict[str, Any]] | None = None
+    rules: list[dict[str, Any]] | None = None
+    alarms: list[dict[str, Any]] | None = None
+    flows: list[dict[str, Any]] | None = None
+    target_lists: list[dict[str, Any]] | None = None
+    stats_simple: dict[str, Any] | None = None
+    errors: dict[str, Exception] = field(default_factory=dict)
+
+
+def _normalize_box(box: dict[str, Any], index: int) -> dict[str, Any]:
+    """Ensure a box payload has an id, deriving one if the API omitted it."""
+    if "id" not in box:
+        box["id"] = (
+            box.get("uuid")
+            or box.get("gid")
+            or box.get("name")
+            or f"box_{index}"
+        )
+    return box
+
+
+def _normalize_device(
+    device: dict[str, Any], index: int, now_ms: float
+) -> dict[str, Any]:
+    """Fill in id, mac and online for a device payload where missing."""
+    if "id" not in device:
+        device["id"] = (
+            device.get("mac")
+            or device.get("ip")
+            or f"device_{index}"
+        )
+    # Ids are usually MAC strings, but guard against numeric ids so the
+    # membership test cannot raise TypeError.
+    device_id = device["id"]
+    if "mac" not in device and isinstance(device_id, str) and ":" in device_id:
+        device["mac"] = device_id
+    if "online" not in device:
+        last_active = device.get("lastActiveTimestamp")
+        if last_active:
+            device["online"] = (now_ms - last_active) < _ONLINE_THRESHOLD_MS
+        else:
+            device["online"] = False
+    return device
+
+
+def _normalize_alarm(alarm: dict[str, Any], index: int) -> dict[str, Any]:
+    """Ensure an alarm payload has an id, falling back to its aid."""
+    if "id" not in alarm:
+        alarm["id"] = f"alarm_{alarm.get('aid', index)}"
+    return alarm
+
 
 class FirewallaApiClient:
     """Firewalla MSP API v2 client."""
 
     def __init__(
         self,
-        session: aiohttp.ClientSession,
+        session: aiohttp.ClientSession | None,
         api_token: str,
         subdomain: str | None = None,
     ) -> None:
-        """Initialise the API client."""
+        """Initialise the API client.
+
+        If ``session`` is None the client creates its own pooled session
+        (see ``create_session``), which must be released with
+        ``async_close``.
+        """
+        self._owns_session = session is None
+        if session is None:
+            session = self.create_session()
         self._session = session
         self._api_token = api_token
+
+        # The token never changes for the lifetime of the client, so the
+        # request headers are built once rather than on every call.
+        self._headers: dict[str, str] = {"Content-Type": "application/json"}
+        if api_token:
+            self._headers["Authorization"] = f"Token {api_token}"
         self._subdomain = subdomain
 
         # Monotonic timestamp after which requests may resume following a 429.
         self._rate_limited_until: float = 0.0
 
+        # endpoint -> (monotonic expiry, value) for endpoints in _CACHE_TTLS.
+        self._cache: dict[str, tuple[float, Any]] = {}
+
+        # (endpoint, params) -> (ETag, raw body) for _CONDITIONAL_ENDPOINTS.
+        # The bytes are decoded afresh on every 304 so callers never share
+        # (and mutate) the same parsed objects across polls.
+        self._etags: dict[
+            tuple[str, tuple[tuple[str, Any], ...]], tuple[str, bytes]
+        ] = {}
+
+        # Optional endpoint -> monotonic time after which a poll that got
+        # 403/404 may probe it again.
+        self._unavailable_until: dict[str, float] = {}
+
         if subdomain:
             self._base_url = f"https://{subdomain}.firewalla.net/v2"
         else:
             self._base_url = DEFAULT_API_URL
 
+        # Full URLs for the fixed collection endpoints polled every refresh.
+        self._urls: dict[str, str] = {
+            endpoint: f"{self._base_url}/{endpoint}"
+            for endpoint in _STATIC_ENDPOINTS
+        }
+
         _LOGGER.debug("Firewalla API client → %s", self._base_url)
 
+    @staticmethod
+    def create_session() -> aiohttp.ClientSession:
+        """Create a ClientSession tuned for the MSP API.
+
+        Pooled connections are reused across the concurrent requests of one
+        poll; the keep-alive is too short to carry them over to the next.
+        The session must be closed by whoever created it. It uses Home
+        Assistant's default SSL context and User-Agent, like sessions from
+        HA's aiohttp_client helper.
+        """
+        return aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(
+                limit_per_host=_FIREWALLA_LIMIT_PER_HOST,
+                keepalive_timeout=_FIREWALLA_KEEPALIVE_TIMEOUT,
+                ttl_dns_cache=_FIREWALLA_DNS_CACHE_TTL,
+                ssl=get_default_context(),
+            ),
+            headers={USER_AGENT: SERVER_SOFTWARE},
+            # Encode request bodies with HA's orjson-backed serializer,
+            # matching the json_loads used for responses.
+            json_serialize=json_dumps,
+        )
+
+    async def async_close(self) -> None:
+        """Close the HTTP session if this client created it."""
+        if self._owns_session and not self._session.closed:
+            await self._session.close()
+
     # ------------------------------------------------------------------
-    # Low-level request helper
+    # Response cache
     # ------------------------------------------------------------------
 
-    @property
-    def _headers(self) -> dict[str, str]:
-        """Return headers for every API request."""
-        headers: dict[str, str] = {"Content-Type": "application/json"}
-        if self._api_token:
-            headers["Authorization"] = f"Token {self._api_token}"
-        return headers
+    def _cache_get(self, endpoint: str) -> Any:
+        """Return the cached value for an endpoint, or None once expired."""
+        cached = self._cache.get(endpoint)
+        if cached is None or time.monotonic() >= cached[0]:
+            return None
+        return cached[1]
+
+    def _cache_put(self, endpoint: str, value: Any) -> None:
+        """Cache a successful response for the endpoint's TTL."""
+        self._cache[endpoint] = (time.monotonic() + _CACHE_TTLS[endpoint], value)
+
+    def invalidate(self, endpoint: str) -> None:
+        """Drop the cached value for an endpoint so the next call refetches."""
+        self._cache.pop(endpoint, None)
+
+    # ------------------------------------------------------------------
+    # Low-level request helper
+    # ------------------------------------------------------------------
 
     async def _api_request(
         self,
@@ -68,9 +259,17 @@ class FirewallaApiClient:
         endpoint: str,
         params: dict[str, Any] | None = None,
         json_data: dict[str, Any] | None = None,
+        *,
+        optional: bool = False,
     ) -> dict[str, Any] | list[dict[str, Any]] | bool | None:
         """Make an API request.
 
+        ``optional`` marks a coordinator poll of a feature endpoint the
+        account's plan may not expose: a 403/404 then suspends polling it
+        for ``_UNAVAILABLE_RETRY`` seconds. Searches and actions never set
+        it, so a rejected query cannot disable polling and always reaches
+        the API.
+
         Raises
         ------
         FirewallaAuthError
@@ -81,7 +280,10 @@ class FirewallaApiClient:
         Parsed JSON (dict or list), ``True`` for 204 No Content,
         or ``None`` on non-auth errors.
         """
-        url = f"{self._base_url}/{endpoint}"
+        if optional and time.monotonic() < self._unavailable_until.get(endpoint, 0.0):
+            return None
+
+        url = self._urls.get(endpoint) or f"{self._base_url}/{endpoint}"
 
         # Honour Retry-After from a previous 429 response.
         now_mono = time.monotonic()
@@ -94,70 +296,118 @@ class FirewallaApiClient:
 
         _LOGGER.debug("%s %s", method, url)
 
+        # Revalidate slow-changing listings with If-None-Match so an
+        # unchanged resource costs a bodyless 304 instead of a full payload.
+        etag_key: tuple[str, tuple[tuple[str, Any], ...]] | None = None
+        headers = self._headers
+        if method == "GET" and endpoint in _CONDITIONAL_ENDPOINTS:
+            etag_key = (endpoint, tuple(sorted(params.items())) if params else ())
+            if (stored := self._etags.get(etag_key)) is not None:
+                headers = {**self._headers, "If-None-Match": stored[0]}
+
         try:
-            async with async_timeout.timeout(DEFAULT_TIMEOUT):
-                response = await self._session.request(
-                    method,
-                    url,
-                    headers=self._headers,
-                    params=params,
-                    json=json_data,
-                )
+            async with self._session.request(
+                method,
+                url,
+                headers=headers,
+                params=params,
+                json=json_data,
+                timeout=_CLIENT_TIMEOUT,
+            ) as response:
+                # Read the body exactly once; every branch below works on
+                # these bytes instead of re-reading or re-decoding it.
+                body = await response.read()
+
+                status = response.status
+                ok = status in _OK_STATUSES
+
+                if status == 304 and (
+                    stored := self._etags.get(etag_key)
+                ) is not None:
+                    # Re-decode the stored body below as if it were a 200.
+                    _LOGGER.debug("%s not modified", url)
+                    body = stored[1]
+                    ok = True
+                elif not ok:
+                    if status == 401:
+                        text = body.decode("utf-8", "replace")
+                        _LOGGER.error("HTTP 401 from %s: %s", url, text)
+                        raise FirewallaAuthError(f"Unauthorized: {text}")
+
+                    if status == 429:
+                        retry_after_hdr = response.headers.get("Retry-After", "60")
+                        try:
+                            retry_seconds = int(retry_after_hdr)
+                        except (ValueError, TypeError):
+                            retry_seconds = 60
+                        retry_seconds = max(30, min(retry_seconds, 600))
+                        self._rate_limited_until = time.monotonic() + retry_seconds
+                        _LOGGER.warning(
+                            "Rate limited (429) from %s — backing off %ds.",
+                            url,
+                            retry_seconds,
+                        )
+                        return None
 
-                if response.status == 401:
-                    body = await response.text()
-                    _LOGGER.error("HTTP 401 from %s: %s", url, body)
-                    raise FirewallaAuthError(f"Unauthorized: {body}")
-
-                if response.status == 429:
-                    body = await response.text()
-                    retry_after_hdr = response.headers.get("Retry-After", "60")
-                    try:
-                        retry_seconds = int(retry_after_hdr)
-                    except (ValueError, TypeError):
-                        retry_seconds = 60
-                    retry_seconds = max(30, min(retry_seconds, 600))
-                    self._rate_limited_until = time.monotonic() + retry_seconds
-                    _LOGGER.warning(
-                        "Rate limited (429) from %s — backing off %ds.",
+                # An HTML page (e.g. a redirect to a login page) announces
+                # itself in its first bytes; sniff only that prefix.
+                ct = response.headers.get("Content-Type", "")
+                if "text/html" in ct and b"<html" in body[:256].lower():
+                    _LOGGER.error(
+                        "HTML instead of JSON from %s (HTTP %s)",
                         url,
-                        retry_seconds,
+                        status,
                     )
                     return None
 
-                ct = response.headers.get("Content-Type", "")
-                if "text/html" in ct:
-                    body = await response.text()
-                    if "<html" in body.lower():
-                        _LOGGER.error(
-                            "HTML instead of JSON from %s (HTTP %s)",
-                            url,
-                            response.status,
-                        )
-                        return None
+                if optional and status in (403, 404):
+                    # The account's plan may not expose this endpoint; back
+                    # off instead of requesting it on every poll, but probe
+                    # again later in case the error was transient.
+                    self._unavailable_until[endpoint] = (
+                        time.monotonic() + _UNAVAILABLE_RETRY
+                    )
+                    _LOGGER.warning(
+                        "HTTP %s from %s — endpoint unavailable, "
+                        "retrying in %ds",
+                        status,
+                        url,
+                        _UNAVAILABLE_RETRY,
+                    )
+                    return None
 
-                if response.status not in (200, 201, 204):
-                    body = await response.text()
-                    _LOGGER.error("HTTP %s from %s: %s", response.status, url, body)
+                if not ok:
+                    _LOGGER.error(
+                        "HTTP %s from %s: %s",
+                        status,
+                        url,
+                        body[:200].decode("utf-8", "replace"),
+                    )
                     return None
 
-                if response.status == 204:
+                if status == 204:
                     return True
 
+                # Decode with HA's orjson-backed loader rather than aiohttp's
+                # stdlib json path; flows and devices payloads can be large.
                 try:
-                    result = await response.json()
-                except aiohttp.ContentTypeError:
-                    body = await response.text()
-                    _LOGGER.error("Invalid JSON from %s: %s", url, body)
+                    result = json_loads(body)
+                except ValueError:
+                    _LOGGER.error(
+                        "Invalid JSON from %s: %s",
+                        url,
+                        body[:200].decode("utf-8", "replace"),
+                    )
                     return None
 
                 # Unwrap {"data": [...]} or {"data": {...}} envelope if present.
-                if (
-                    isinstance(result, dict)
-                    and "data" in result
-                    and isinstance(result["data"], (list, dict))
+                if isinstance(result, dict) and isinstance(
+                    envelope := result.get("data"), (list, dict)
                 ):
-                    return result["data"]
+                    result = envelope
+
+                if etag_key is not None and (etag := response.headers.get("ETag")):
+                    self._etags[etag_key] = (etag, body)
 
                 return result
 
@@ -177,6 +427,52 @@ class FirewallaApiClient:
     # Core data endpoints
     # ------------------------------------------------------------------
 
+    async def get_all(
+        self,
+        *,
+        rules: bool,
+        alarms: bool,
+        flows: bool,
+        target_lists: bool,
+    ) -> FirewallaBundle:
+        """Fetch boxes, devices, simple stats and the enabled extras at once.
+
+        All requests run concurrently, so a poll costs roughly one round-trip
+        instead of one per endpoint. Per-endpoint exceptions are collected on
+        the bundle rather than raised, so one failure does not discard the
+        other results.
+        """
+        fetches: dict[str, Callable[[], Awaitable[Any]]] = {
+            "boxes": self.get_boxes,
+            "devices": self.get_devices,
+            "stats_simple": self.get_simple_stats,
+        }
+        if rules:
+            fetches["rules"] = self.get_rules
+        if alarms:
+            fetches["alarms"] = self.get_alarms
+        if flows:
+            fetches["flows"] = self.get_flows
+        if target_lists:
+            fetches["target_lists"] = self.get_target_lists
+
+        # Eager tasks run up to their first await immediately, so every
+        # request is on the wire before the event loop yields.
+        results = await asyncio.gather(
+            *(create_eager_task(fetch()) for fetch in fetches.values()),
+            return_exceptions=True,
+        )
+
+        bundle = FirewallaBundle()
+        for key, result in zip(fetches, results):
+            if isinstance(result, Exception):
+                bundle.errors[key] = result
+            elif isinstance(result, BaseException):
+                raise result
+            else:
+                setattr(bundle, key, result)
+        return bundle
+
     async def get_boxes(self) -> list[dict[str, Any]] | None:
         """GET /v2/boxes — list all Firewalla boxes."""
         try:
@@ -194,18 +490,10 @@ class FirewallaApiClient:
             _LOGGER.warning("get_boxes: unexpected type %s", type(result))
             return None
 
-        processed: list[dict[str, Any]] = []
-        for box in result:
-            if not isinstance(box, dict):
-                continue
-            if "id" not in box:
-                box["id"] = (
-                    box.get("uuid")
-                    or box.get("gid")
-                    or box.get("name")
-                    or f"box_{len(processed)}"
-                )
-            processed.append(box)
+        # JSON decoding only ever yields plain dicts for objects, so an exact
+        # type check is equivalent to isinstance() and cheaper per item.
+        boxes = [box for box in result if type(box) is dict]
+        processed = [_normalize_box(box, index) for index, box in enumerate(boxes)]
 
         _LOGGER.debug("Retrieved %d boxes", len(processed))
         return processed
@@ -227,26 +515,13 @@ class FirewallaApiClient:
             _LOGGER.warning("get_devices: unexpected type %s", type(result))
             return None
 
-        processed: list[dict[str, Any]] = []
-        for device in result:
-            if not isinstance(device, dict):
-                continue
-            if "id" not in device:
-                device["id"] = (
-                    device.get("mac")
-                    or device.get("ip")
-                    or f"device_{len(processed)}"
-                )
-            if "mac" not in device and ":" in device.get("id", ""):
-                device["mac"] = device["id"]
-            if "online" not in device:
-                last_active = device.get("lastActiveTimestamp")
-                if last_active:
-                    now_ms = datetime.now(tz=timezone.utc).timestamp() * 1000
-                    device["online"] = (now_ms - last_active) < (15 * 60 * 1000)
-                else:
-                    device["online"] = False
-            processed.append(device)
+        # One clock read for the whole batch instead of a datetime per device.
+        now_ms = time.time() * 1000.0
+        devices = [device for device in result if type(device) is dict]
+        processed = [
+            _normalize_device(device, index, now_ms)
+            for index, device in enumerate(devices)
+        ]
 
         _LOGGER.debug("Retrieved %d devices", len(processed))
         return processed
@@ -258,42 +533,33 @@ class FirewallaApiClient:
         Previously fetched only the first page, causing newly-created rules
         to be silently omitted if they appeared on subsequent pages.
         """
-        all_rules: list[dict[str, Any]] = []
-        params: dict[str, Any] = {"limit": 200}
-
-        for _page in range(_MAX_PAGES):
-            try:
-                result = await self._api_request("GET", "rules", params=params)
-            except FirewallaAuthError:
-                raise
-            except Exception as exc:  # noqa: BLE001
-                _LOGGER.error("Error getting rules (page %d): %s", _page, exc)
-                break
-
-            if not result:
-                break
-
-            if isinstance(result, dict):
-                results = result.get("results", [])
-                next_cursor = result.get("next_cursor")
-            elif isinstance(result, list):
-                # API returned a bare list — no pagination available
-                results = result
-                next_cursor = None
-            else:
-                break
+        cached = self._cache_get("rules")
+        if cached is not None:
+            return cached
 
-            for rule in results:
-                if isinstance(rule, dict):
-                    all_rules.append(rule)
+        all_rules: list[dict[str, Any]] = []
+        complete = False
 
-            if not next_cursor:
-                break
-            params["cursor"] = next_cursor
+        try:
+            async for rules, more in self._paginate(
+                "rules", {"limit": 200}, optional=True
+            ):
+                all_rules.extend(rules)
+                complete = not more
+        except FirewallaAuthError:
+            raise
+        except Exception as exc:  # noqa: BLE001
+            _LOGGER.error("Error getting rules: %s", exc)
 
         _LOGGER.debug("Retrieved %d rules", len(all_rules))
-        for rule in all_rules:
-            _LOGGER.debug("Rule payload: %s", rule)
+        # Skip the per-rule loop entirely unless debug logging is on.
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            for rule in all_rules:
+                _LOGGER.debug("Rule payload: %s", rule)
+        # Only a fully paginated result is worth caching; a partial list
+        # after an error would otherwise hide rules until the TTL expires.
+        if complete:
+            self._cache_put("rules", all_rules)
         return all_rules
 
     async def get_alarms(self) -> list[dict[str, Any]]:
@@ -301,36 +567,19 @@ class FirewallaApiClient:
         all_alarms: list[dict[str, Any]] = []
         params: dict[str, Any] = {"query": "status:active", "limit": 200}
 
-        for _page in range(_MAX_PAGES):
-            try:
-                result = await self._api_request("GET", "alarms", params=params)
-            except FirewallaAuthError:
-                raise
-            except Exception as exc:  # noqa: BLE001
-                _LOGGER.error("Error getting alarms: %s", exc)
-                break
-
-            if not result:
-                break
-
-            if isinstance(result, dict):
-                results = result.get("results", [])
-                next_cursor = result.get("next_cursor")
-            elif isinstance(result, list):
-                results = result
-                next_cursor = None
-            else:
-                break
-
-            for alarm in results:
-                if isinstance(alarm, dict):
-                    if "id" not in alarm:
-                        alarm["id"] = f"alarm_{alarm.get('aid', len(all_alarms))}"
-                    all_alarms.append(alarm)
-
-            if not next_cursor or len(all_alarms) >= 4000:
-                break
-            params["cursor"] = next_cursor
+        try:
+            async for alarms, _more in self._paginate("alarms", params, optional=True):
+                offset = len(all_alarms)
+                all_alarms.extend(
+                    _normalize_alarm(alarm, offset + index)
+                    for index, alarm in enumerate(alarms)
+                )
+                if len(all_alarms) >= 4000:
+                    break
+        except FirewallaAuthError:
+            raise
+        except Exception as exc:  # noqa: BLE001
+            _LOGGER.error("Error getting alarms: %s", exc)
 
         _LOGGER.debug("Retrieved %d alarms", len(all_alarms))
         return all_alarms
@@ -338,7 +587,7 @@ class FirewallaApiClient:
     async def get_flows(self) -> list[dict[str, Any]]:
         """GET /v2/flows — list recent network flows."""
         try:
-            result = await self._api_request("GET", "flows")
+            result = await self._api_request("GET", "flows", optional=True)
         except FirewallaAuthError:
             raise
         except Exception as exc:  # noqa: BLE001
@@ -346,32 +595,43 @@ class FirewallaApiClient:
             return []
 
         if isinstance(result, dict) and "results" in result:
-            return result["results"] if isinstance(result["results"], list) else []
-        return result if isinstance(result, list) else []
+            result = result["results"]
+        if not isinstance(result, list):
+            return []
+        return [flow for flow in result if type(flow) is dict]
 
     async def get_target_lists(self) -> list[dict[str, Any]]:
         """GET /v2/target-lists — list all target lists."""
         try:
-            result = await self._api_request("GET", "target-lists")
+            result = await self._api_request("GET", "target-lists", optional=True)
         except FirewallaAuthError:
             raise
         except Exception as exc:  # noqa: BLE001
             _LOGGER.error("Error getting target lists: %s", exc)
             return []
 
-        return result if isinstance(result, list) else []
+        if not isinstance(result, list):
+            return []
+        return [tl for tl in result if type(tl) is dict]
 
     async def get_simple_stats(self) -> dict[str, Any]:
         """GET /v2/stats/simple — lightweight fleet health stats."""
+        cached = self._cache_get("stats/simple")
+        if cached is not None:
+            return cached
+
         try:
-            result = await self._api_request("GET", "stats/simple")
+            result = await self._api_request("GET", "stats/simple", optional=True)
         except FirewallaAuthError:
             raise
         except Exception as exc:  # noqa: BLE001
             _LOGGER.error("Error getting stats/simple: %s", exc)
             return {}
 
-        return result if isinstance(result, dict) else {}
+        if not isinstance(result, dict):
+            return {}
+        self._cache_put("stats/simple", result)
+        return result
 
     # ------------------------------------------------------------------
     # Action endpoints
@@ -411,7 +671,10 @@ class FirewallaApiClient:
         except Exception as exc:  # noqa: BLE001
             _LOGGER.error("Error pausing rule %s: %s", rule_id, exc)
             return False
-        return result is not None
+        if result is None:
+            return False
+        self.invalidate("rules")
+        return True
 
     async def async_resume_rule(self, rule_id: str) -> bool:
         """POST /v2/rules/:id/resume — resume a paused rule."""
@@ -422,7 +685,10 @@ class FirewallaApiClient:
         except Exception as exc:  # noqa: BLE001
             _LOGGER.error("Error resuming rule %s: %s", rule_id, exc)
             return False
-        return result is not None
+        if result is None:
+            return False
+        self.invalidate("rules")
+        return True
 
     async def async_rename_device(
         self, box_id: str, device_id: str, name: str
@@ -472,25 +738,55 @@ class FirewallaApiClient:
         all_results: list[dict[str, Any]] = []
         params: dict[str, Any] = {"query": query, "limit": limit}
 
-        for _page in range(max_pages):
-            try:
-                result = await self._api_request("GET", endpoint, params=params)
-            except FirewallaAuthError:
-                raise
-            except Exception as exc:  # noqa: BLE001
-                _LOGGER.warning("Search %s page %d error: %s", endpoint, _page, exc)
-                break
-
-            if not result or not isinstance(result, dict):
-                break
-
-            results = result.get("results", [])
-            if isinstance(results, list):
+        try:
+            async for results, _more in self._paginate(endpoint, params, max_pages):
                 all_results.extend(results)
+        except FirewallaAuthError:
+            raise
+        except Exception as exc:  # noqa: BLE001
+            _LOGGER.warning("Search %s error: %s", endpoint, exc)
+
+        return {"count": len(all_results), "results": all_results}
+
+    async def _paginate(
+        self,
+        endpoint: str,
+        params: dict[str, Any],
+        max_pages: int = _MAX_PAGES,
+        *,
+        optional: bool = False,
+    ) -> AsyncIterator[tuple[list[dict[str, Any]], bool]]:
+        """Yield ``(items, more)`` for each page of a cursored endpoint.
+
+        Handles both the ``{"results": [...], "next_cursor": ...}`` envelope
+        and a bare list (no pagination). ``more`` is True while a further
+        page was advertised, so a caller can tell an exhausted cursor from
+        a run cut short by an empty response or ``max_pages``. Request
+        errors propagate to the caller; ``optional`` is passed through to
+        :meth:`_api_request`.
+        """
+        params = dict(params)
+        for _page in range(max_pages):
+            result = await self._api_request(
+                "GET", endpoint, params=params, optional=optional
+            )
+            if not result:
+                return
+
+            if isinstance(result, dict):
+                results = result.get("results", [])
+                next_cursor = result.get("next_cursor")
+            elif isinstance(result, list):
+                # API returned a bare list — no pagination available
+                results = result
+                next_cursor = None
+            else:
+                return
+
+            if not isinstance(results, list):
+                return
+            yield [item for item in results if type(item) is dict], bool(next_cursor)
 
-            next_cursor = result.get("next_cursor")
             if not next_cursor:
-                break
+                return
             params["cursor"] = next_cursor
-
-        return {"count": len(all_results), "results": all_results}
@@ -2,6 +2,9 @@
 from __future__ import annotations
 
 import logging
+from abc import abstractmethod
+from collections.abc import Callable
+from functools import partial
 from typing import Any
 
 from homeassistant.components.binary_sensor import (
@@ -17,12 +20,19 @@ from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from .const import (
     ATTR_ALARM_ID,
     ATTR_RULE_ID,
-    CONF_ENABLE_ALARMS,
-    CONF_ENABLE_RULES,
     DOMAIN,
+    UID_PREFIX_ALARM,
+    UID_PREFIX_RULE,
 )
 from .coordinator import FirewallaCoordinator
-from .helpers import box_display_name, first_box_id, rule_display_name, safe_configuration_url
+from .helpers import (
+    box_device_info,
+    box_display_name,
+    first_box_id,
+    nested_get,
+    rule_display_name,
+    safe_configuration_url,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -38,62 +48,41 @@ async def async_setup_entry(
     if not coordinator.data:
         return
 
-    def _opt(key: str) -> bool:
-        return entry.options.get(key, entry.data.get(key, False))
-
-    enable_rules = _opt(CONF_ENABLE_RULES)
-    enable_alarms = _opt(CONF_ENABLE_ALARMS)
-
-    known_box_ids: set[str] = set()
-    known_device_ids: set[str] = set()
-    known_rule_ids: set[str] = set()
-    known_alarm_ids: set[str] = set()
+    settings = entry.runtime_data.settings
+
+    # (coordinator data key, ids already registered, entity factory).
+    # Every factory takes the payload item and the fallback box id so one
+    # comprehension can build all sections.
+    sections: list[
+        tuple[str, set[str], Callable[[dict[str, Any], str], BinarySensorEntity]]
+    ] = [
+        ("boxes", set(), lambda box, _: FirewallaBoxOnlineSensor(coordinator, box)),
+        (
+            "devices",
+            set(),
+            lambda device, _: FirewallaDeviceOnlineSensor(coordinator, device),
+        ),
+    ]
+    if settings.enable_rules:
+        sections.append(("rules", set(), partial(FirewallaRuleActiveSensor, coordinator)))
+    if settings.enable_alarms:
+        sections.append(("alarms", set(), partial(FirewallaAlarmSensor, coordinator)))
 
     @callback
     def _async_add_new_entities() -> None:
         """Discover and register new binary sensor entities on each coordinator update."""
-        if not coordinator.data:
+        data = coordinator.data
+        if not data:
             return
 
-        new_entities: list[BinarySensorEntity] = []
-
-        # Box connectivity (always enabled)
-        for box in coordinator.data.get("boxes", []):
-            if not isinstance(box, dict) or "id" not in box:
-                continue
-            box_id = str(box["id"])
-            if box_id not in known_box_ids:
-                known_box_ids.add(box_id)
-                new_entities.append(FirewallaBoxOnlineSensor(coordinator, box))
-
-        # Device connectivity (always enabled)
-        for device in coordinator.data.get("devices", []):
-            if not isinstance(device, dict) or "id" not in device:
-                continue
-            device_id = str(device["id"])
-            if device_id not in known_device_ids:
-                known_device_ids.add(device_id)
-                new_entities.append(FirewallaDeviceOnlineSensor(coordinator, device))
-
-        # Rules (optional)
-        if enable_rules:
-            for rule in coordinator.data.get("rules", []):
-                if not isinstance(rule, dict) or "id" not in rule:
-                    continue
-                rule_id = str(rule["id"])
-                if rule_id not in known_rule_ids:
-                    known_rule_ids.add(rule_id)
-                    new_entities.append(FirewallaRuleActiveSensor(coordinator, rule))
-
-        # Individual alarm sensors (optional)
-        if enable_alarms:
-            for alarm in coordinator.data.get("alarms", []):
-                if not isinstance(alarm, dict) or "id" not in alarm:
-                    continue
-                alarm_id = str(alarm["id"])
-                if alarm_id not in known_alarm_ids:
-                    known_alarm_ids.add(alarm_id)
-                    new_entities.append(FirewallaAlarmSensor(coordinator, alarm))
+        # Fallback parent for rules/alarms without a gid, resolved once per pass.
+        default_box_id = first_box_id(data)
+        new_entities = [
+            factory(item, default_box_id)
+            for key, known_ids, factory in sections
+            for item in data.get(key, ())
+            if "id" in item and _claim(known_ids, item["id"])
+        ]
 
         if new_entities:
             async_add_entities(new_entities)
@@ -105,6 +94,15 @@ async def async_setup_entry(
     entry.async_on_unload(coordinator.async_add_listener(_async_add_new_entities))
 
 
+def _claim(known_ids: set[str], item_id: Any) -> bool:
+    """Record an id as seen, returning True only the first time."""
+    key = str(item_id)
+    if key in known_ids:
+        return False
+    known_ids.add(key)
+    return True
+
+
 # ---------------------------------------------------------------------------
 # Base
 # ---------------------------------------------------------------------------
@@ -114,6 +112,37 @@ class _FirewallaBinarySensor(CoordinatorEntity[FirewallaCoordinator], BinarySens
     """Shared base for all Firewalla binary sensors."""
 
     _attr_has_entity_name = True
+    _last_written: tuple[Any, ...] | None = None
+
+    @abstractmethod
+    def _get_record(self) -> dict[str, Any] | None:
+        """Return this entity's payload from the latest refresh."""
+
+    @abstractmethod
+    def _update_state(self, record: dict[str, Any]) -> None:
+        """Apply a payload to is_on and the state attributes."""
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Update from the latest payload unless nothing this entity shows changed.
+
+        Most refreshes leave a sensor untouched. Comparing availability,
+        is_on and the attributes with the last written values skips the
+        state write, which is the expensive part.
+        """
+        record = self._get_record()
+        if not record:
+            return
+        self._update_state(record)
+        snapshot = (
+            self.available,
+            self._attr_is_on,
+            self._attr_extra_state_attributes,
+        )
+        if snapshot == self._last_written:
+            return
+        self._last_written = snapshot
+        self.async_write_ha_state()
 
 
 # ---------------------------------------------------------------------------
@@ -143,24 +172,8 @@ class FirewallaBoxOnlineSensor(_FirewallaBinarySensor):
         )
         self._update_state(box)
 
-    def _get_box(self) -> dict[str, Any] | None:
-        if not self.coordinator.data:
-            return None
-        return next(
-            (
-                b
-                for b in self.coordinator.data.get("boxes", [])
-                if b.get("id") == self._box_id
-            ),
-            None,
-        )
-
-    @callback
-    def _handle_coordinator_update(self) -> None:
-        box = self._get_box()
-        if box:
-            self._update_state(box)
-            self.async_write_ha_state()
+    def _get_record(self) -> dict[str, Any] | None:
+        return self.coordinator.boxes_by_id.get(self._box_id)
 
     def _update_state(self, box: dict[str, Any]) -> None:
         self._attr_is_on = box.get("online", False)
@@ -206,31 +219,15 @@ class FirewallaDeviceOnlineSensor(_FirewallaBinarySensor):
         )
         self._update_state(device)
 
-    def _get_device(self) -> dict[str, Any] | None:
-        if not self.coordinator.data:
-            return None
-        return next(
-            (
-                d
-                for d in self.coordinator.data.get("devices", [])
-                if d.get("id") == self._device_id
-            ),
-            None,
-        )
-
-    @callback
-    def _handle_coordinator_update(self) -> None:
-        device = self._get_device()
-        if device:
-            self._update_state(device)
-            self.async_write_ha_state()
+    def _get_record(self) -> dict[str, Any] | None:
+        return self.coordinator.devices_by_id.get(self._device_id)
 
     def _update_state(self, device: dict[str, Any]) -> None:
         self._attr_is_on = device.get("online", False)
         self._attr_extra_state_attributes = {
             "ip_address": device.get("ip"),
             "mac_address": device.get("mac"),
-            "network": device.get("network", {}).get("name"),
+            "network": nested_get(device, "network", "name"),
             "last_active": device.get("lastActiveTimestamp"),
         }
 
@@ -247,36 +244,23 @@ class FirewallaRuleActiveSensor(_FirewallaBinarySensor):
     _attr_translation_key = "rule_active"
 
     def __init__(
-        self, coordinator: FirewallaCoordinator, rule: dict[str, Any]
+        self,
+        coordinator: FirewallaCoordinator,
+        rule: dict[str, Any],
+        default_box_id: str,
     ) -> None:
         super().__init__(coordinator)
         self._rule_id = rule["id"]
-        self._attr_unique_id = f"{DOMAIN}_rule_{self._rule_id}"
+        self._attr_unique_id = f"{UID_PREFIX_RULE}{self._rule_id}"
 
         devices = coordinator.data.get("devices", []) if coordinator.data else []
         self._attr_name = rule_display_name(rule, devices)
 
-        box_id = rule.get("gid") or first_box_id(coordinator.data)
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, f"box_{box_id}")},
-        )
+        self._attr_device_info = box_device_info(rule.get("gid") or default_box_id)
         self._update_state(rule)
 
-    @callback
-    def _handle_coordinator_update(self) -> None:
-        if not self.coordinator.data:
-            return
-        rule = next(
-            (
-                r
-                for r in self.coordinator.data.get("rules", [])
-                if r.get("id") == self._rule_id
-            ),
-            None,
-        )
-        if rule:
-            self._update_state(rule)
-            self.async_write_ha_state()
+    def _get_record(self) -> dict[str, Any] | None:
+        return self.coordinator.rules_by_id.get(self._rule_id)
 
     def _update_state(self, rule: dict[str, Any]) -> None:
         self._attr_is_on = rule.get("status") == "active"
@@ -300,57 +284,40 @@ class FirewallaAlarmSensor(_FirewallaBinarySensor):
     _attr_translation_key = "alarm_active"
 
     def __init__(
-        self, coordinator: FirewallaCoordinator, alarm: dict[str, Any]
+        self,
+        coordinator: FirewallaCoordinator,
+        alarm: dict[str, Any],
+        default_box_id: str,
     ) -> None:
         super().__init__(coordinator)
         self._alarm_id = alarm["id"]
-        self._attr_unique_id = f"{DOMAIN}_alarm_{self._alarm_id}"
+        self._attr_unique_id = f"{UID_PREFIX_ALARM}{self._alarm_id}"
 
         msg = alarm.get("message") or alarm.get("type") or self._alarm_id
         self._attr_name = f"Alarm: {msg[:40]}"
 
-        box_id = alarm.get("gid") or first_box_id(coordinator.data)
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, f"box_{box_id}")},
-        )
+        self._attr_device_info = box_device_info(alarm.get("gid") or default_box_id)
         self._update_state(alarm)
 
-    @callback
-    def _handle_coordinator_update(self) -> None:
-        if not self.coordinator.data:
-            return
-        alarm = next(
-            (
-                a
-                for a in self.coordinator.data.get("alarms", [])
-                if a.get("id") == self._alarm_id
-            ),
-            None,
-        )
-        if alarm:
-            self._update_state(alarm)
-            self.async_write_ha_state()
+    def _get_record(self) -> dict[str, Any] | None:
+        return self.coordinator.alarms_by_id.get(str(self._alarm_id))
+
+    def _device_name(self, device_id: str | None) -> str | None:
+        """Resolve the alarm's device id to its current name, if known."""
+        if not device_id:
+            return None
+        matched = self.coordinator.devices_by_id.get(device_id)
+        return matched.get("name") if matched else device_id
 
     def _update_state(self, alarm: dict[str, Any]) -> None:
         self._attr_is_on = alarm.get("status", 1) != 2
 
-        device_id = (alarm.get("device") or {}).get("id")
-        device_name: str | None = None
-        if device_id and self.coordinator.data:
-            matched = next(
-                (
-                    d for d in self.coordinator.data.get("devices", [])
-                    if d.get("id") == device_id
-                ),
-                None,
-            )
-            device_name = matched.get("name") if matched else device_id
-
+        device_id = nested_get(alarm, "device", "id")
         self._attr_extra_state_attributes = {
             ATTR_ALARM_ID: self._alarm_id,
             "message": alarm.get("message"),
             "type": alarm.get("type"),
             "timestamp": alarm.get("ts"),
             "device_id": device_id,
-            "device_name": device_name,
+            "device_name": self._device_name(device_id),
         }
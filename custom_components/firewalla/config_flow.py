@@ -55,6 +55,45 @@ def _validate_subdomain(value: str) -> str:
     return value
 
 
+def _box_selector(boxes: list[dict[str, Any]]) -> SelectSelector:
+    """Return a multi-select listing each box as 'name — model (location)'."""
+    options = [
+        {
+            "value": box["id"],
+            "label": (
+                f"{box.get('name', box['id'])}"
+                + (f" — {box.get('model', '')}" if box.get("model") else "")
+                + (f" ({box.get('location', '')})" if box.get("location") else "")
+            ),
+        }
+        for box in boxes
+        if "id" in box
+    ]
+    return SelectSelector(
+        SelectSelectorConfig(
+            options=options,
+            multiple=True,
+            mode=SelectSelectorMode.LIST,
+        )
+    )
+
+
+# Shared validators; both the setup and options forms accept the same ranges.
+_SCAN_INTERVAL_VALIDATOR = vol.All(int, vol.Range(min=30, max=86400))
+_STALE_DAYS_VALIDATOR = vol.All(int, vol.Range(min=1, max=365))
+
+# Feature toggles offered at setup. Their defaults never depend on user
+# input, so the markers are built once rather than on every form render.
+_USER_TOGGLE_FIELDS: dict[vol.Marker, Any] = {
+    vol.Optional(CONF_ENABLE_ALARMS, default=False): bool,
+    vol.Optional(CONF_ENABLE_RULES, default=False): bool,
+    vol.Optional(CONF_ENABLE_FLOWS, default=False): bool,
+    vol.Optional(CONF_ENABLE_TRAFFIC, default=False): bool,
+    vol.Optional(CONF_ENABLE_TARGET_LISTS, default=False): bool,
+    vol.Optional(CONF_TRACK_DEVICES, default=True): bool,
+}
+
+
 class FirewallaConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     """Handle the initial setup config flow for Firewalla."""
 
@@ -119,13 +158,8 @@ class FirewallaConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                     default=(user_input or {}).get(
                         CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL
                     ),
-                ): vol.All(int, vol.Range(min=30, max=86400)),
-                vol.Optional(CONF_ENABLE_ALARMS, default=False): bool,
-                vol.Optional(CONF_ENABLE_RULES, default=False): bool,
-                vol.Optional(CONF_ENABLE_FLOWS, default=False): bool,
-                vol.Optional(CONF_ENABLE_TRAFFIC, default=False): bool,
-                vol.Optional(CONF_ENABLE_TARGET_LISTS, default=False): bool,
-                vol.Optional(CONF_TRACK_DEVICES, default=True): bool,
+                ): _SCAN_INTERVAL_VALIDATOR,
+                **_USER_TOGGLE_FIELDS,
             }
         )
 
@@ -146,27 +180,10 @@ class FirewallaConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
         all_gids = [b["id"] for b in self._boxes if "id" in b]
 
-        options = [
-            {
-                "value": box["id"],
-                "label": (
-                    f"{box.get('name', box['id'])}"
-                    + (f" — {box.get('model', '')}" if box.get("model") else "")
-                    + (f" ({box.get('location', '')})" if box.get("location") else "")
-                ),
-            }
-            for box in self._boxes
-            if "id" in box
-        ]
-
         schema = vol.Schema(
             {
-                vol.Optional(CONF_BOX_FILTER, default=all_gids): SelectSelector(
-                    SelectSelectorConfig(
-                        options=options,
-                        multiple=True,
-                        mode=SelectSelectorMode.LIST,
-                    )
+                vol.Optional(CONF_BOX_FILTER, default=all_gids): _box_selector(
+                    self._boxes
                 ),
             }
         )
@@ -235,7 +252,7 @@ class FirewallaOptionsFlow(config_entries.OptionsFlow):
             vol.Optional(
                 CONF_SCAN_INTERVAL,
                 default=_current(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL),
-            ): vol.All(int, vol.Range(min=30, max=86400)),
+            ): _SCAN_INTERVAL_VALIDATOR,
             vol.Optional(
                 CONF_ENABLE_ALARMS,
                 default=_current(CONF_ENABLE_ALARMS, False),
@@ -263,7 +280,7 @@ class FirewallaOptionsFlow(config_entries.OptionsFlow):
             vol.Optional(
                 CONF_STALE_DAYS,
                 default=_current(CONF_STALE_DAYS, DEFAULT_STALE_DAYS),
-            ): vol.All(int, vol.Range(min=1, max=365)),
+            ): _STALE_DAYS_VALIDATOR,
             vol.Optional(
                 CONF_DEBUG_LOGGING,
                 default=_current(CONF_DEBUG_LOGGING, False),
@@ -274,27 +291,9 @@ class FirewallaOptionsFlow(config_entries.OptionsFlow):
         if len(boxes) > 1:
             all_gids = [b["id"] for b in boxes if "id" in b]
             current_filter = _current(CONF_BOX_FILTER, all_gids)
-            options = [
-                {
-                    "value": box["id"],
-                    "label": (
-                        f"{box.get('name', box['id'])}"
-                        + (f" — {box.get('model', '')}" if box.get("model") else "")
-                        + (f" ({box.get('location', '')})" if box.get("location") else "")
-                    ),
-                }
-                for box in boxes
-                if "id" in box
-            ]
             schema_fields[
                 vol.Optional(CONF_BOX_FILTER, default=current_filter)
-            ] = SelectSelector(
-                SelectSelectorConfig(
-                    options=options,
-                    multiple=True,
-                    mode=SelectSelectorMode.LIST,
-                )
-            )
+            ] = _box_selector(boxes)
 
         return self.async_show_form(
             step_id="init",
@@ -37,6 +37,17 @@ DEFAULT_TIMEOUT: Final = 30
 STORAGE_KEY: Final = f"{DOMAIN}.device_seen"
 STORAGE_VERSION: Final = 1
 
+# Unique-id prefixes, shared by the platforms and orphaned-entity cleanup
+UID_PREFIX_ALARM: Final = f"{DOMAIN}_alarm_"
+UID_PREFIX_ALARM_COUNT: Final = f"{DOMAIN}_alarm_count_"
+UID_PREFIX_RULE: Final = f"{DOMAIN}_rule_"
+UID_PREFIX_RULE_SWITCH: Final = f"{DOMAIN}_rule_switch_"
+UID_PREFIX_FLOW: Final = f"{DOMAIN}_flow_"
+UID_PREFIX_TOTAL_DOWNLOAD: Final = f"{DOMAIN}_total_download_"
+UID_PREFIX_TOTAL_UPLOAD: Final = f"{DOMAIN}_total_upload_"
+UID_PREFIX_TRACKER: Final = f"{DOMAIN}_tracker_"
+UID_PREFIX_TARGET_LIST: Final = f"{DOMAIN}_target_list_"
+
 # Service names
 SERVICE_DELETE_ALARM: Final = "delete_alarm"
 SERVICE_RENAME_DEVICE: Final = "rename_device"
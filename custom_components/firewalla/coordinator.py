@@ -2,10 +2,13 @@
 from __future__ import annotations
 
 import logging
+from collections.abc import Mapping
+from dataclasses import dataclass
 from datetime import datetime, timedelta
 from typing import Any
 
 from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import CONF_SCAN_INTERVAL
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import ConfigEntryAuthFailed
 from homeassistant.helpers import device_registry as dr
@@ -13,14 +16,17 @@ from homeassistant.helpers.storage import Store
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 from homeassistant.util import dt as dt_util
 
-from .api import FirewallaApiClient
+from .api import FirewallaApiClient, FirewallaBundle
 from .const import (
     CONF_BOX_FILTER,
     CONF_ENABLE_ALARMS,
     CONF_ENABLE_FLOWS,
     CONF_ENABLE_RULES,
     CONF_ENABLE_TARGET_LISTS,
+    CONF_ENABLE_TRAFFIC,
     CONF_STALE_DAYS,
+    CONF_TRACK_DEVICES,
+    DEFAULT_SCAN_INTERVAL,
     DEFAULT_STALE_DAYS,
     DOMAIN,
     FirewallaAuthError,
@@ -31,6 +37,40 @@ from .const import (
 _LOGGER = logging.getLogger(__name__)
 
 
+@dataclass(frozen=True, slots=True)
+class FirewallaSettings:
+    """Feature toggles and polling settings resolved once per entry setup.
+
+    Options changes always reload the entry, so a snapshot taken at setup
+    stays current for the lifetime of the coordinator.
+    """
+
+    enable_alarms: bool
+    enable_rules: bool
+    enable_flows: bool
+    enable_traffic: bool
+    enable_target_lists: bool
+    track_devices: bool
+    scan_interval: int
+
+    @classmethod
+    def from_entry(cls, entry: ConfigEntry) -> FirewallaSettings:
+        """Resolve settings from entry options, falling back to entry data."""
+
+        def _opt(key: str, default: Any) -> Any:
+            return entry.options.get(key, entry.data.get(key, default))
+
+        return cls(
+            enable_alarms=_opt(CONF_ENABLE_ALARMS, False),
+            enable_rules=_opt(CONF_ENABLE_RULES, False),
+            enable_flows=_opt(CONF_ENABLE_FLOWS, False),
+            enable_traffic=_opt(CONF_ENABLE_TRAFFIC, False),
+            enable_target_lists=_opt(CONF_ENABLE_TARGET_LISTS, False),
+            track_devices=_opt(CONF_TRACK_DEVICES, True),
+            scan_interval=_opt(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL),
+        )
+
+
 class FirewallaCoordinator(DataUpdateCoordinator[dict[str, Any]]):
     """Manage Firewalla data fetching and stale-device cleanup."""
 
@@ -39,17 +79,18 @@ class FirewallaCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         hass: HomeAssistant,
         client: FirewallaApiClient,
         entry: ConfigEntry,
-        update_interval: timedelta,
+        settings: FirewallaSettings,
     ) -> None:
         """Initialise the coordinator."""
         super().__init__(
             hass,
             _LOGGER,
             name=f"{DOMAIN}_{entry.entry_id}",
-            update_interval=update_interval,
+            update_interval=timedelta(seconds=settings.scan_interval),
             config_entry=entry,
         )
         self._client = client
+        self._settings = settings
         # Maps device id -> last datetime we saw it in the API response
         self._device_last_seen: dict[str, datetime] = {}
         # Tracks which device ids have been present across all updates
@@ -57,6 +98,14 @@ class FirewallaCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         # Device IDs present in the previous poll — used to detect
         # the Present→Absent transition for store persistence.
         self._last_poll_present: set[str] = set()
+        # Per-refresh id indexes so lookups by id are O(1) dict probes
+        # instead of linear scans over the coordinator lists.
+        self._boxes_by_id: dict[str, dict[str, Any]] = {}
+        self._devices_by_id: dict[str, dict[str, Any]] = {}
+        self._rules_by_id: dict[str, dict[str, Any]] = {}
+        self._alarms_by_id: dict[str, dict[str, Any]] = {}
+        self._flows_by_id: dict[str, dict[str, Any]] = {}
+        self._target_lists_by_id: dict[str, dict[str, Any]] = {}
         # Persistent store — keyed per config entry so multi-account installs don't collide
         self._store: Store = Store(
             hass,
@@ -109,22 +158,102 @@ class FirewallaCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         """Read a config option, falling back to config entry data."""
         return self.config_entry.options.get(key, self.config_entry.data.get(key, default))
 
+    @property
+    def boxes_by_id(self) -> Mapping[str, dict[str, Any]]:
+        """Boxes from the latest refresh, keyed by box id."""
+        return self._boxes_by_id
+
+    @property
+    def devices_by_id(self) -> Mapping[str, dict[str, Any]]:
+        """Devices from the latest refresh, keyed by device id."""
+        return self._devices_by_id
+
+    @property
+    def rules_by_id(self) -> Mapping[str, dict[str, Any]]:
+        """Rules from the latest refresh, keyed by rule id."""
+        return self._rules_by_id
+
+    @property
+    def alarms_by_id(self) -> Mapping[str, dict[str, Any]]:
+        """Alarms from the latest refresh, keyed by str(id) and str(aid)."""
+        return self._alarms_by_id
+
+    @property
+    def flows_by_id(self) -> Mapping[str, dict[str, Any]]:
+        """Flows from the latest refresh, keyed by flow id."""
+        return self._flows_by_id
+
+    @property
+    def target_lists_by_id(self) -> Mapping[str, dict[str, Any]]:
+        """Target lists from the latest refresh, keyed by target list id."""
+        return self._target_lists_by_id
+
+    def _build_indexes(self, data: dict[str, Any]) -> None:
+        """Rebuild the id indexes from a freshly fetched data payload."""
+        self._boxes_by_id = {
+            b["id"]: b
+            for b in data.get("boxes", [])
+            if "id" in b
+        }
+        self._devices_by_id = {
+            d["id"]: d
+            for d in data.get("devices", [])
+            if "id" in d
+        }
+        self._rules_by_id = {
+            r["id"]: r
+            for r in data.get("rules", [])
+            if "id" in r
+        }
+        alarms_by_id: dict[str, dict[str, Any]] = {}
+        for alarm in data.get("alarms", []):
+            if "id" not in alarm:
+                continue
+            alarms_by_id[str(alarm["id"])] = alarm
+            # Services may be called with the raw aid rather than the id.
+            if alarm.get("aid") is not None:
+                alarms_by_id.setdefault(str(alarm["aid"]), alarm)
+        self._alarms_by_id = alarms_by_id
+        self._flows_by_id = {
+            f["id"]: f
+            for f in data.get("flows", [])
+            if "id" in f
+        }
+        self._target_lists_by_id = {
+            tl["id"]: tl
+            for tl in data.get("target_lists", [])
+            if "id" in tl
+        }
+
     # ------------------------------------------------------------------
     # Main update
     # ------------------------------------------------------------------
 
     async def _async_update_data(self) -> dict[str, Any]:
         """Fetch all enabled data from the Firewalla MSP API."""
+        settings = self._settings
+        bundle = await self._client.get_all(
+            rules=settings.enable_rules,
+            alarms=settings.enable_alarms,
+            flows=settings.enable_flows,
+            target_lists=settings.enable_target_lists,
+        )
+
+        for exc in bundle.errors.values():
+            if isinstance(exc, FirewallaAuthError):
+                # Translate to ConfigEntryAuthFailed so HA's first_refresh
+                # machinery (raise_on_auth_failed=True) propagates it to
+                # async_setup_entry rather than wrapping it in
+                # ConfigEntryNotReady. This triggers HA's re-auth notification
+                # instead of looping retry. v2.4.9: this applies to optional
+                # endpoints too — otherwise a revoked token is silently
+                # ignored and the user never sees a re-auth prompt.
+                raise ConfigEntryAuthFailed(
+                    f"Invalid Firewalla API token — re-enter your credentials: {exc}"
+                ) from exc
+
         try:
-            boxes, devices = await self._fetch_core_data()
-        except FirewallaAuthError as exc:
-            # Translate to ConfigEntryAuthFailed so HA's first_refresh machinery
-            # (raise_on_auth_failed=True) propagates it to async_setup_entry rather
-            # than wrapping it in ConfigEntryNotReady. This triggers HA's re-auth
-            # notification instead of looping retry.
-            raise ConfigEntryAuthFailed(
-                f"Invalid Firewalla API token — re-enter your credentials: {exc}"
-            ) from exc
+            boxes, devices = self._resolve_core_data(bundle)
         except Exception as exc:
             if self.data:
                 _LOGGER.warning("API error - using cached data: %s", exc)
@@ -137,44 +266,28 @@ class FirewallaCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             "flows": [],
             "target_lists": [],
         }
+        for key, fetched in (
+            ("rules", bundle.rules),
+            ("alarms", bundle.alarms),
+            ("flows", bundle.flows),
+            ("target_lists", bundle.target_lists),
+        ):
+            if key in bundle.errors:
+                _LOGGER.warning("Could not fetch %s: %s", key, bundle.errors[key])
+                if self.data:
+                    results[key] = self.data.get(key, [])
+            elif fetched:
+                results[key] = fetched
 
-        optional_fetches = [
-            ("rules", CONF_ENABLE_RULES, self._client.get_rules),
-            ("alarms", CONF_ENABLE_ALARMS, self._client.get_alarms),
-            ("flows", CONF_ENABLE_FLOWS, self._client.get_flows),
-            ("target_lists", CONF_ENABLE_TARGET_LISTS, self._client.get_target_lists),
-        ]
-
-        for key, flag, func in optional_fetches:
-            if self._opt(flag):
-                try:
-                    results[key] = await func() or []
-                except FirewallaAuthError as exc:
-                    # v2.4.9: Auth errors must propagate even from optional
-                    # endpoints — otherwise a revoked token is silently ignored
-                    # until the next core data fetch, and the user never sees
-                    # a re-auth prompt.
-                    raise ConfigEntryAuthFailed(
-                        f"Invalid Firewalla API token — re-enter your credentials: {exc}"
-                    ) from exc
-                except Exception as exc:  # noqa: BLE001
-                    _LOGGER.warning("Could not fetch %s: %s", key, exc)
-                    if self.data:
-                        results[key] = self.data.get(key, [])
-
-        # Always fetch simple stats — single lightweight call, no toggle needed
         stats_simple: dict[str, Any] = {}
-        try:
-            stats_simple = await self._client.get_simple_stats()
-        except FirewallaAuthError as exc:
-            # v2.4.9: Same auth propagation as optional fetches above.
-            raise ConfigEntryAuthFailed(
-                f"Invalid Firewalla API token — re-enter your credentials: {exc}"
-            ) from exc
-        except Exception as exc:  # noqa: BLE001
-            _LOGGER.warning("Could not fetch stats/simple: %s", exc)
+        if "stats_simple" in bundle.errors:
+            _LOGGER.warning(
+                "Could not fetch stats/simple: %s", bundle.errors["stats_simple"]
+            )
             if self.data:
                 stats_simple = self.data.get("stats_simple", {})
+        elif bundle.stats_simple is not None:
+            stats_simple = bundle.stats_simple
 
         data = {
             "boxes": boxes,
@@ -182,10 +295,11 @@ class FirewallaCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             "stats_simple": stats_simple,
             **results,
         }
+        self._build_indexes(data)
 
         # Update the seen-timestamp for every device in this poll
         now = dt_util.now()
-        current_ids = {d["id"] for d in devices if isinstance(d, dict) and "id" in d}
+        current_ids = {d["id"] for d in devices if "id" in d}
 
         # Detect the Present→Absent transition: devices that were in the
         # *previous* poll but are missing from *this* poll.  Using
@@ -213,24 +327,29 @@ class FirewallaCoordinator(DataUpdateCoordinator[dict[str, Any]]):
 
         return data
 
-    async def _fetch_core_data(
-        self,
+    def _resolve_core_data(
+        self, bundle: FirewallaBundle
     ) -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
-        """Fetch boxes and devices, raising on total failure.
+        """Resolve boxes and devices from a fetch, raising on total failure.
 
         If box_filter is configured, only boxes and devices belonging to
         the selected box GIDs are returned.
         """
-        boxes = await self._client.get_boxes()
-        devices = await self._client.get_devices()
+        for key in ("boxes", "devices"):
+            if key in bundle.errors:
+                _LOGGER.warning("Could not fetch %s: %s", key, bundle.errors[key])
+        boxes = bundle.boxes
+        devices = bundle.devices
 
         # v2.4.9: get_boxes/get_devices now return None on API failure
-        # (distinct from [] for a genuine empty response). Coerce to empty
-        # list for downstream processing.
+        # (distinct from [] for a genuine empty response). Fall back to the
+        # last good value for just the endpoint that failed, so one flaky
+        # endpoint does not discard fresh data from the other.
+        prev = self.data or {}
         if boxes is None:
-            boxes = []
+            boxes = prev.get("boxes", [])
         if devices is None:
-            devices = []
+            devices = prev.get("devices", [])
 
         if not boxes and not devices:
             raise UpdateFailed("Both boxes and devices endpoints returned empty — possible API failure")
@@ -11,7 +11,7 @@ from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import CONF_TRACK_DEVICES, DOMAIN
+from .const import DOMAIN, UID_PREFIX_TRACKER
 from .coordinator import FirewallaCoordinator
 from .helpers import box_display_name
 
@@ -24,9 +24,7 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up Firewalla device trackers."""
-    if not entry.options.get(
-        CONF_TRACK_DEVICES, entry.data.get(CONF_TRACK_DEVICES, True)
-    ):
+    if not entry.runtime_data.settings.track_devices:
         return
 
     coordinator: FirewallaCoordinator = entry.runtime_data.coordinator
@@ -44,7 +42,7 @@ async def async_setup_entry(
 
         new_entities: list[ScannerEntity] = []
         for device in coordinator.data.get("devices", []):
-            if not isinstance(device, dict) or "id" not in device:
+            if "id" not in device:
                 continue
             device_id = str(device["id"])
             if device_id not in known_device_ids:
@@ -76,15 +74,14 @@ class FirewallaDeviceTracker(CoordinatorEntity[FirewallaCoordinator], ScannerEnt
         # by MAC continue to work even when the device is offline.
         self._mac = device.get("mac", "")
 
-        self._attr_unique_id = f"{DOMAIN}_tracker_{self._device_id}"
+        self._attr_unique_id = f"{UID_PREFIX_TRACKER}{self._device_id}"
         self._attr_name = device.get("name", f"Device {self._device_id}")
 
         # Attach to the correct parent box using the device's gid/boxId field.
         boxes = coordinator.data.get("boxes", []) if coordinator.data else []
         device_box_gid = device.get("gid") or device.get("boxId")
-        parent_box = next(
-            (b for b in boxes if b.get("id") == device_box_gid),
-            boxes[0] if boxes else {},
+        parent_box = coordinator.boxes_by_id.get(device_box_gid) or (
+            boxes[0] if boxes else {}
         )
         box_id = parent_box.get("id", "firewalla_hub")
 
@@ -122,16 +119,7 @@ class FirewallaDeviceTracker(CoordinatorEntity[FirewallaCoordinator], ScannerEnt
 
     def _current_device(self) -> dict[str, Any]:
         """Look up the latest data for this device from the coordinator."""
-        if not self.coordinator.data:
-            return {}
-        return next(
-            (
-                d
-                for d in self.coordinator.data.get("devices", [])
-                if d.get("id") == self._device_id
-            ),
-            {},
-        )
+        return self.coordinator.devices_by_id.get(self._device_id) or {}
 
     @callback
     def _handle_coordinator_update(self) -> None:
@@ -3,6 +3,11 @@ from __future__ import annotations
 
 import ipaddress
 import logging
+from typing import Any
+
+from homeassistant.helpers.device_registry import DeviceInfo
+
+from .const import DOMAIN
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -29,6 +34,25 @@ def first_box_id(coordinator_data: dict | None) -> str:
     return boxes[0].get("id", "unknown") if boxes else "unknown"
 
 
+def nested_get(payload: dict, key: str, field: str) -> Any:
+    """Return ``payload[key][field]``, or None if ``payload[key]`` is not a dict.
+
+    Nested objects such as a device's ``network`` or an alarm's ``device``
+    are often absent or null; checking the type avoids allocating a
+    throwaway ``{}`` default on every lookup.
+    """
+    inner = payload.get(key)
+    return inner.get(field) if type(inner) is dict else None
+
+
+def box_device_info(box_id: str) -> DeviceInfo:
+    """Return the DeviceInfo that attaches an entity to a box's device.
+
+    Used by rules, alarms and flows, which only reference their parent box.
+    """
+    return DeviceInfo(identifiers={(DOMAIN, f"box_{box_id}")})
+
+
 def safe_configuration_url(raw_ip: str | None) -> str | None:
     """Return an https URL for the box's public IP, or None if invalid.
 
@@ -19,14 +19,13 @@ from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import (
-    CONF_ENABLE_ALARMS,
-    CONF_ENABLE_FLOWS,
-    CONF_ENABLE_TARGET_LISTS,
-    CONF_ENABLE_TRAFFIC,
     DOMAIN,
+    UID_PREFIX_ALARM_COUNT,
+    UID_PREFIX_FLOW,
+    UID_PREFIX_TARGET_LIST,
 )
 from .coordinator import FirewallaCoordinator
-from .helpers import box_display_name
+from .helpers import box_device_info, nested_get
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -42,13 +41,11 @@ async def async_setup_entry(
     if not coordinator.data:
         return
 
-    def _opt(key: str) -> bool:
-        return entry.options.get(key, entry.data.get(key, False))
-
-    enable_traffic = _opt(CONF_ENABLE_TRAFFIC)
-    enable_flows = _opt(CONF_ENABLE_FLOWS)
-    enable_alarms = _opt(CONF_ENABLE_ALARMS)
-    enable_target_lists = _opt(CONF_ENABLE_TARGET_LISTS)
+    settings = entry.runtime_data.settings
+    enable_traffic = settings.enable_traffic
+    enable_flows = settings.enable_flows
+    enable_alarms = settings.enable_alarms
+    enable_target_lists = settings.enable_target_lists
 
     # MSP summary sensors and alarm count are singletons — add them once
     # at setup time; they reference coordinator.data directly and never
@@ -80,7 +77,7 @@ async def async_setup_entry(
 
         # Per-device identity and bandwidth sensors
         for device in coordinator.data.get("devices", []):
-            if not isinstance(device, dict) or "id" not in device:
+            if "id" not in device:
                 continue
             device_id = str(device["id"])
             if device_id not in known_device_ids:
@@ -99,22 +96,22 @@ async def async_setup_entry(
             device_by_id: dict[str, dict[str, Any]] = {
                 d["id"].upper(): d
                 for d in coordinator.data.get("devices", [])
-                if isinstance(d, dict) and "id" in d
+                if "id" in d
             }
             for flow in coordinator.data.get("flows", []):
-                if not isinstance(flow, dict) or "id" not in flow:
+                if "id" not in flow:
                     continue
                 flow_id = str(flow["id"])
                 if flow_id not in known_flow_ids:
                     known_flow_ids.add(flow_id)
-                    flow_device_id = (flow.get("device") or {}).get("id", "").upper()
+                    flow_device_id = (nested_get(flow, "device", "id") or "").upper()
                     flow_device = device_by_id.get(flow_device_id) if flow_device_id else None
                     new_entities.append(FirewallaFlowSensor(coordinator, flow, flow_device))
 
         # Target list sensors
         if enable_target_lists:
             for tl in coordinator.data.get("target_lists", []):
-                if not isinstance(tl, dict) or "id" not in tl:
+                if "id" not in tl:
                     continue
                 tl_id = str(tl["id"])
                 if tl_id not in known_target_list_ids:
@@ -163,16 +160,7 @@ class _FirewallaSensor(CoordinatorEntity[FirewallaCoordinator], SensorEntity):
         )
 
     def _get_device(self) -> dict[str, Any] | None:
-        if not self.coordinator.data:
-            return None
-        return next(
-            (
-                d
-                for d in self.coordinator.data.get("devices", [])
-                if d.get("id") == self._device_id
-            ),
-            None,
-        )
+        return self.coordinator.devices_by_id.get(self._device_id)
 
 
 # ---------------------------------------------------------------------------
@@ -217,7 +205,7 @@ class FirewallaNetworkNameSensor(_FirewallaSensor):
         device = self._get_device()
         if not device:
             return None
-        return device.get("network", {}).get("name")
+        return nested_get(device, "network", "name")
 
 
 # ---------------------------------------------------------------------------
@@ -287,7 +275,7 @@ class FirewallaAlarmCountSensor(CoordinatorEntity[FirewallaCoordinator], SensorE
 
     def __init__(self, coordinator: FirewallaCoordinator) -> None:
         super().__init__(coordinator)
-        self._attr_unique_id = f"{DOMAIN}_alarm_count_{coordinator.config_entry.entry_id}"
+        self._attr_unique_id = f"{UID_PREFIX_ALARM_COUNT}{coordinator.config_entry.entry_id}"
         self._attr_device_info = DeviceInfo(
             identifiers={(DOMAIN, f"msp_global_{coordinator.config_entry.entry_id}")},
             name="Firewalla MSP",
@@ -301,7 +289,7 @@ class FirewallaAlarmCountSensor(CoordinatorEntity[FirewallaCoordinator], SensorE
         if not self.coordinator.data:
             return 0
         alarms = self.coordinator.data.get("alarms", [])
-        return sum(1 for a in alarms if isinstance(a, dict) and a.get("status", 1) != 2)
+        return sum(1 for a in alarms if a.get("status", 1) != 2)
 
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
@@ -316,7 +304,7 @@ class FirewallaAlarmCountSensor(CoordinatorEntity[FirewallaCoordinator], SensorE
                 "ts": a.get("ts"),
             }
             for a in alarms
-            if isinstance(a, dict) and a.get("status", 1) != 2
+            if a.get("status", 1) != 2
         ][:10]
         return {
             "total_alarms": len(alarms),
@@ -345,7 +333,7 @@ class FirewallaFlowSensor(CoordinatorEntity[FirewallaCoordinator], SensorEntity)
     ) -> None:
         super().__init__(coordinator)
         self._flow_id = flow["id"]
-        self._attr_unique_id = f"{DOMAIN}_flow_{self._flow_id}"
+        self._attr_unique_id = f"{UID_PREFIX_FLOW}{self._flow_id}"
 
         if device:
             self._attr_device_info = DeviceInfo(
@@ -359,22 +347,11 @@ class FirewallaFlowSensor(CoordinatorEntity[FirewallaCoordinator], SensorEntity)
                 if flow_box_gid
                 else (boxes[0].get("id", "global") if boxes else "global")
             )
-            self._attr_device_info = DeviceInfo(
-                identifiers={(DOMAIN, f"box_{fallback_box_id}")},
-            )
+            self._attr_device_info = box_device_info(fallback_box_id)
 
     @property
     def native_value(self) -> float | None:
-        if not self.coordinator.data:
-            return None
-        flow = next(
-            (
-                f
-                for f in self.coordinator.data.get("flows", [])
-                if f.get("id") == self._flow_id
-            ),
-            None,
-        )
+        flow = self.coordinator.flows_by_id.get(self._flow_id)
         if not flow:
             return None
         return round(
@@ -460,6 +437,7 @@ class FirewallaTargetListSensor(CoordinatorEntity[FirewallaCoordinator], SensorE
     _attr_translation_key = "target_list"
     _attr_state_class = SensorStateClass.MEASUREMENT
     _attr_native_unit_of_measurement = "entries"
+    _last_updated: tuple[Any, str] | None = None
 
     def __init__(
         self,
@@ -469,7 +447,7 @@ class FirewallaTargetListSensor(CoordinatorEntity[FirewallaCoordinator], SensorE
         super().__init__(coordinator)
         self._tl_id: str = tl["id"]
         self._attr_unique_id = (
-            f"{DOMAIN}_target_list_{self._tl_id}_{coordinator.config_entry.entry_id}"
+            f"{UID_PREFIX_TARGET_LIST}{self._tl_id}_{coordinator.config_entry.entry_id}"
         )
         self._attr_name = tl.get("name", self._tl_id)
         self._attr_device_info = DeviceInfo(
@@ -481,16 +459,7 @@ class FirewallaTargetListSensor(CoordinatorEntity[FirewallaCoordinator], SensorE
         )
 
     def _get_tl(self) -> dict[str, Any] | None:
-        if not self.coordinator.data:
-            return None
-        return next(
-            (
-                tl
-                for tl in self.coordinator.data.get("target_lists", [])
-                if tl.get("id") == self._tl_id
-            ),
-            None,
-        )
+        return self.coordinator.target_lists_by_id.get(self._tl_id)
 
     @property
     def native_value(self) -> int | None:
@@ -507,20 +476,27 @@ class FirewallaTargetListSensor(CoordinatorEntity[FirewallaCoordinator], SensorE
         if not tl:
             return {}
 
-        last_updated_raw = tl.get("lastUpdated")
-        last_updated_iso: str | None = None
-        if last_updated_raw is not None:
-            try:
-                last_updated_iso = datetime.fromtimestamp(
-                    float(last_updated_raw), tz=timezone.utc
-                ).isoformat()
-            except (ValueError, TypeError, OSError):
-                last_updated_iso = str(last_updated_raw)
-
         return {
             "owner": tl.get("owner"),
             "category": tl.get("category"),
             "notes": tl.get("notes"),
             "targets": tl.get("targets", []),
-            "last_updated": last_updated_iso,
+            "last_updated": self._format_last_updated(tl.get("lastUpdated")),
         }
+
+    def _format_last_updated(self, raw: Any) -> str | None:
+        """Return lastUpdated as ISO 8601, reusing the last result if unchanged.
+
+        Target lists rarely change, so the same epoch value comes back on
+        almost every refresh; only a new value pays for the datetime round trip.
+        """
+        if raw is None:
+            return None
+        if self._last_updated is not None and self._last_updated[0] == raw:
+            return self._last_updated[1]
+        try:
+            iso = datetime.fromtimestamp(float(raw), tz=timezone.utc).isoformat()
+        except (ValueError, TypeError, OSError):
+            iso = str(raw)
+        self._last_updated = (raw, iso)
+        return iso
@@ -7,13 +7,12 @@ from typing import Any
 from homeassistant.components.switch import SwitchEntity
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant, callback
-from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import ATTR_RULE_ID, CONF_ENABLE_RULES, DOMAIN
+from .const import ATTR_RULE_ID, UID_PREFIX_RULE_SWITCH
 from .coordinator import FirewallaCoordinator
-from .helpers import first_box_id, rule_display_name
+from .helpers import box_device_info, first_box_id, rule_display_name
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -24,7 +23,7 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up Firewalla rule switches."""
-    if not entry.options.get(CONF_ENABLE_RULES, entry.data.get(CONF_ENABLE_RULES, False)):
+    if not entry.runtime_data.settings.enable_rules:
         return
 
     coordinator: FirewallaCoordinator = entry.runtime_data.coordinator
@@ -48,14 +47,18 @@ async def async_setup_entry(
         )
 
         new_entities: list[SwitchEntity] = []
+        # Fallback parent for rules without a gid, resolved once per pass.
+        default_box_id = first_box_id(coordinator.data)
         for rule in rules:
-            if not isinstance(rule, dict) or "id" not in rule:
+            if "id" not in rule:
                 continue
             rule_id = str(rule["id"])
             if rule_id not in known_rule_ids:
                 _LOGGER.debug("Registering new rule entity: %s", rule_id)
                 known_rule_ids.add(rule_id)
-                new_entities.append(FirewallaRuleSwitch(coordinator, rule))
+                new_entities.append(
+                    FirewallaRuleSwitch(coordinator, rule, default_box_id)
+                )
 
         if new_entities:
             _LOGGER.debug("Adding %d new rule switch entities", len(new_entities))
@@ -75,32 +78,23 @@ class FirewallaRuleSwitch(CoordinatorEntity[FirewallaCoordinator], SwitchEntity)
     _attr_translation_key = "rule_switch"
 
     def __init__(
-        self, coordinator: FirewallaCoordinator, rule: dict[str, Any]
+        self,
+        coordinator: FirewallaCoordinator,
+        rule: dict[str, Any],
+        default_box_id: str,
     ) -> None:
         super().__init__(coordinator)
         self._rule_id = rule["id"]
-        self._attr_unique_id = f"{DOMAIN}_rule_switch_{self._rule_id}"
+        self._attr_unique_id = f"{UID_PREFIX_RULE_SWITCH}{self._rule_id}"
 
         devices = coordinator.data.get("devices", []) if coordinator.data else []
         self._attr_name = rule_display_name(rule, devices)
 
-        box_id = rule.get("gid") or first_box_id(coordinator.data)
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, f"box_{box_id}")},
-        )
+        self._attr_device_info = box_device_info(rule.get("gid") or default_box_id)
 
     def _get_rule(self) -> dict[str, Any] | None:
         """Return the latest rule data from the coordinator."""
-        if not self.coordinator.data:
-            return None
-        return next(
-            (
-                r
-                for r in self.coordinator.data.get("rules", [])
-                if r.get("id") == self._rule_id
-            ),
-            None,
-        )
+        return self.coordinator.rules_by_id.get(self._rule_id)
 
     @property
     def is_on(self) -> bool:
@@ -126,7 +120,7 @@ class FirewallaRuleSwitch(CoordinatorEntity[FirewallaCoordinator], SwitchEntity)
         client = self.coordinator.config_entry.runtime_data.client
         _LOGGER.debug("Resuming rule %s", self._rule_id)
         if await client.async_resume_rule(self._rule_id):
-            await self.coordinator.async_request_refresh()
+            self._async_apply_status("active")
         else:
             _LOGGER.error("Failed to resume rule %s", self._rule_id)
 
@@ -135,10 +129,25 @@ class FirewallaRuleSwitch(CoordinatorEntity[FirewallaCoordinator], SwitchEntity)
         client = self.coordinator.config_entry.runtime_data.client
         _LOGGER.debug("Pausing rule %s", self._rule_id)
         if await client.async_pause_rule(self._rule_id):
-            await self.coordinator.async_request_refresh()
+            self._async_apply_status("paused")
         else:
             _LOGGER.error("Failed to pause rule %s", self._rule_id)
 
+    @callback
+    def _async_apply_status(self, status: str) -> None:
+        """Reflect a successful pause/resume without refetching every endpoint.
+
+        The API call already succeeded, so patch the cached rule in place and
+        notify listeners (this switch and the matching rule binary sensor).
+        The next scheduled poll reconciles with the server.
+        """
+        rule = self._get_rule()
+        if rule is None:
+            self.hass.async_create_task(self.coordinator.async_request_refresh())
+            return
+        rule["status"] = status
+        self.coordinator.async_update_listeners()
+
     @callback
     def _handle_coordinator_update(self) -> None:
         self.async_write_ha_state()